@@ -26,7 +26,6 @@ def main():
     """
     # 무거운 모듈 지연 로딩 (import 시간 단축)
     from core.init_app import init_app
-    from core.utils import load_logs_as_df, render_llm_diagnostics
     from ui.components.summary_box import render as SummaryBox
     from ui.components.news_list import render as NewsList
     from ui.components.article_detail import render as ArticleDetail
@@ -44,15 +43,7 @@ def main():
     # 세션 및 사용자 초기화 - 매번 호출하여 URL 변경 감지
     # user_id는 URL/localStorage에서 가져오므로 매번 업데이트 필요
     init_session_and_user()
-    
-    # 세션 상태 기본값 설정 (빠름)
-    st.session_state.setdefault("selected_article", None)
-    st.session_state.setdefault("chat_history", [])
-    st.session_state.setdefault("term_click_count", 0)
-    st.session_state.setdefault("news_click_count", 0)
-    st.session_state.setdefault("chat_count", 0)
-    st.session_state.setdefault("detail_enter_logged", False)
-    st.session_state.setdefault("news_articles", [])
+    # (세션 상태 기본값도 init_session_and_user()에서 함께 설정)
     
     # ③ 뉴스 로드 및 백그라운드 초기화 (비동기로 실행)
     import threading
@@ -152,7 +143,7 @@ def main():
     with col_chat:
         # 텍스트 사전이 준비되었는지 확인
         if st.session_state.get("terms_initialized", False):
-            ChatPanel(st.session_state.financial_terms, use_openai=USE_OPENAI)
+            ChatPanel(st.session_state.financial_terms)
         else:
             # 아직 초기화 중이면 간단한 메시지만 표시 (블로킹 없음)
             st.info("💡 금융 용어 사전을 불러오는 중...")
@@ -1,8 +1,8 @@
 # === 부트스트랩 인라인 ===
-from core.user import init_session_and_user
+from core.user import init_session_and_user, ensure_session_defaults
 from core.logger import log_event, _ensure_backend_user, _ensure_backend_session
 from data.news import load_news_cached
-from rag.glossary import ensure_financial_terms
+from rag.glossary import ensure_financial_terms, prewarm_highlight_index
 from core.config import API_ENABLE
 import streamlit as st
 
@@ -19,13 +19,7 @@ def init_app():
         st.session_state["user_initialized"] = True
 
     # ✅ 2. 세션 상태 기본값 설정 - 필수 (빠름)
-    st.session_state.setdefault("selected_article", None)
-    st.session_state.setdefault("chat_history", [])
-    st.session_state.setdefault("term_click_count", 0)
-    st.session_state.setdefault("news_click_count", 0)
-    st.session_state.setdefault("chat_count", 0)
-    st.session_state.setdefault("detail_enter_logged", False)
-    st.session_state.setdefault("news_articles", [])
+    ensure_session_defaults()
 
     # ✅ 3. 뉴스 데이터 먼저 수집 (실제 DB 뉴스 우선 표시)
     # ✅ 최적화: 뉴스는 블로킹되어도 됨 (사용자가 뉴스를 먼저 보고 싶어함)
@@ -50,6 +44,12 @@ def init_app_background():
         # 텍스트 사전만 빠르게 로드 (스피너 없이 즉시 완료)
         ensure_financial_terms()
         st.session_state["terms_initialized"] = True
+        # ✅ 성능 개선: 하이라이트 용어 인덱스를 미리 생성 (첫 기사 상세 진입 지연 감소)
+        # (여기서는 텍스트 사전용 - RAG 용어 세트 인덱스는 RAG 초기화 완료 시 _cache_rag_metadata에서 생성)
+        try:
+            prewarm_highlight_index()
+        except Exception:
+            pass
 
     # ✅ 2. 서버 연결 시 자동으로 UUID로 교체 및 세션 생성 (지연 실행)
     # ✅ 최적화: 이미 연결되었으면 스킵
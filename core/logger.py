@@ -4,9 +4,17 @@ import csv
 import uuid
 import json
 import time
+import copy
+import queue
+import socket
+import secrets
+import atexit
 import threading
-from datetime import datetime, timezone
-from typing import Optional, Dict, Any, Tuple
+import traceback
+from collections import deque
+from datetime import datetime, timezone, timedelta
+from typing import Optional, Dict, Any, List, Tuple
+from urllib.parse import urlparse
 import streamlit as st
 from streamlit_js_eval import streamlit_js_eval
 from core.config import (
@@ -15,6 +23,7 @@ from core.config import (
     CSV_ENABLE, ANONYMOUS_USER_ID, AGENT_ID_MAPPING, EVENT_TO_INTERACTION_TYPE,
     SUPABASE_ENABLE, SUPABASE_URL, SUPABASE_KEY
 )
+from core.user import get_or_create_user_id
 
 # requests 라이브러리 (API 호출용)
 try:
@@ -49,9 +58,48 @@ CSV_HEADER = [
     "payload"
 ]
 
+# 용어 버튼 클릭 1회(클릭 + 자동 질문 + 답변)를 한 행으로 기록하는 이벤트
+# - 서버(Supabase/API)로는 대화 생성 흐름을 유지하기 위해 glossary_click / glossary_answer로 나눠 전송
+GLOSSARY_INTERACTION_EVENT = "glossary_interaction"
+
+# 통합 이벤트 → 해당 이벤트가 대신하는 기존 이벤트 (로그 집계 시 별칭으로 사용)
+LEGACY_EVENT_ALIASES = {
+    "glossary_click": (GLOSSARY_INTERACTION_EVENT,),
+    "glossary_answer": (GLOSSARY_INTERACTION_EVENT,),
+}
+
 def now_utc_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
+def _build_supabase_http2_options() -> Optional[Any]:
+    """
+    Supabase REST 요청을 HTTP/2 하나의 연결로 다중화하는 ClientOptions 생성
+    - httpx[http2](h2) 와 httpx_client 옵션을 지원하는 supabase 버전에서만 사용
+    - 조건이 안 맞으면 None → 기본(HTTP/1.1) 클라이언트 사용
+    """
+    try:
+        import h2  # noqa: F401  (httpx의 http2=True는 h2 패키지 필요)
+        import httpx
+        from supabase import ClientOptions
+    except ImportError:
+        return None
+
+    try:
+        http_client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=10.0,
+        )
+    except Exception:
+        return None
+
+    try:
+        return ClientOptions(httpx_client=http_client)
+    except TypeError:
+        http_client.close()
+        return None  # httpx_client 옵션이 없는 supabase 버전
+
+
 @st.cache_resource
 def get_supabase_client() -> Optional[Any]:
     """
@@ -82,6 +130,12 @@ def get_supabase_client() -> Optional[Any]:
     
     try:
         from supabase import create_client
+        options = _build_supabase_http2_options()
+        if options is not None:
+            try:
+                return create_client(SUPABASE_URL, SUPABASE_KEY, options=options)
+            except Exception:
+                pass  # HTTP/2 옵션을 지원하지 않는 버전이면 기본 클라이언트 사용
         return create_client(SUPABASE_URL, SUPABASE_KEY)
     except Exception as e:
         # Supabase 에러는 항상 표시 (API 설정과 무관)
@@ -119,6 +173,23 @@ def _as_json_text(x) -> str:
 # API 클라이언트 함수들
 # ─────────────────────────────────────────────────────────────
 
+@st.cache_resource
+def _get_http_session() -> Optional[Any]:
+    """
+    백엔드 API 호출용 requests.Session 생성 (st.cache_resource로 캐싱)
+    - keep-alive 연결 풀을 재사용하므로 연속 요청(사용자 조회 → 세션 생성 등)에서
+      TCP/TLS 연결 수립 비용(1 RTT 이상)을 다시 내지 않음
+    - urllib3 연결 풀은 스레드별로 연결을 빌려가므로 백그라운드 로깅 스레드에서도 안전
+    """
+    if not REQUESTS_AVAILABLE:
+        return None
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 def _get_backend_session_id() -> Optional[int]:
     """백엔드 세션 ID를 가져옵니다 (없으면 None)"""
     return st.session_state.get("backend_session_id")
@@ -140,7 +211,6 @@ def _get_user_id(captured_user_id=None) -> str:
         pass
 
     # 3. session_state에 없으면 익명 사용자 ID 반환
-    from core.config import ANONYMOUS_USER_ID
     return ANONYMOUS_USER_ID
 
 
@@ -177,6 +247,15 @@ def _fetch_user_by_username(username: str) -> Optional[str]:
     return None
 
 
+def _get_session_password() -> str:
+    """사용자 생성용 임시 비밀번호를 세션당 한 번만 생성해서 재사용"""
+    password = st.session_state.get("_backend_user_password")
+    if not password:
+        password = secrets.token_urlsafe(16)
+        st.session_state["_backend_user_password"] = password
+    return password
+
+
 def _generate_email_from_user_id(user_id: str, is_legacy_format: bool) -> str:
     """user_id를 기반으로 이메일 주소 생성"""
     # UUID 형식: 하이픈 제거하고 사용
@@ -194,6 +273,28 @@ def _generate_email_from_user_id(user_id: str, is_legacy_format: bool) -> str:
     return f"{email_local_part}@example.com"
 
 
+def _response_error_detail(response: requests.Response, limit: int = 200) -> str:
+    """에러 응답 본문에서 detail을 한 번만 파싱해서 문자열로 반환"""
+    if not response.text:
+        return "알 수 없는 오류"
+    try:
+        body = response.json()
+    except ValueError:
+        return response.text[:limit]
+    detail = body.get("detail", response.text[:limit]) if isinstance(body, dict) else body
+    if isinstance(detail, list):
+        detail = "; ".join(str(e) for e in detail)
+    return str(detail)
+
+
+def _show_response_body(response: requests.Response, limit: int = 200) -> None:
+    """응답 본문을 JSON이면 st.json, 아니면 텍스트로 표시 (디버깅용)"""
+    try:
+        st.json(response.json())
+    except ValueError:
+        st.text(response.text[:limit])
+
+
 def _log_api_error(operation: str, response: Optional[requests.Response], 
                    error_msg: Optional[str] = None, extra_info: Optional[str] = None,
                    silent: bool = False) -> None:
@@ -211,13 +312,7 @@ def _log_api_error(operation: str, response: Optional[requests.Response],
     
     try:
         if response:
-            try:
-                error_detail = response.json().get("detail", response.text[:200]) if response.text else "알 수 없는 오류"
-                if isinstance(error_detail, list):
-                    error_detail = "; ".join(str(e) for e in error_detail)
-                error_msg = f"{operation} ({response.status_code}): {error_detail}"
-            except:
-                error_msg = f"{operation} ({response.status_code}): {response.text[:200] if response.text else '알 수 없는 오류'}"
+            error_msg = f"{operation} ({response.status_code}): {_response_error_detail(response)}"
         elif error_msg:
             error_msg = f"{operation}: {error_msg}"
         else:
@@ -232,8 +327,6 @@ def _log_api_error(operation: str, response: Optional[requests.Response],
 
 def _diagnose_connection_error(url: str, error: Exception) -> str:
     """연결 에러의 상세 원인 진단"""
-    import socket
-    from urllib.parse import urlparse
     
     try:
         parsed = urlparse(url)
@@ -296,7 +389,7 @@ def _api_request_with_retry(method: str, url: str, silent: bool = False, **kwarg
     last_exception = None
     for attempt in range(API_RETRY_COUNT):
         try:
-            response = requests.request(method, url, timeout=5, **kwargs)
+            response = _get_http_session().request(method, url, timeout=5, **kwargs)
             # 2xx 성공 또는 4xx 클라이언트 에러는 재시도하지 않음
             if 200 <= response.status_code < 500:
                 return response
@@ -376,8 +469,10 @@ def _ensure_backend_user(user_id: str, silent: bool = False) -> bool:
     if not REQUESTS_AVAILABLE or not API_ENABLE:
         return False
     
-    # 이미 생성 시도했고 backend_user_id가 있으면 성공으로 간주
-    if st.session_state.get("backend_user_created", False) and st.session_state.get("backend_user_id"):
+    # ✅ 최적화: backend_user_id가 이미 있으면 서버 사용자가 확정된 것이므로 성공으로 간주
+    # (backend_user_created 플래그와 무관하게 POST/GET 재확인 요청을 보내지 않음)
+    if st.session_state.get("backend_user_id"):
+        st.session_state["backend_user_created"] = True
         return True
     
     # backend_user_id가 없으면 조회 시도 (이미 존재하는 사용자일 수 있음)
@@ -385,10 +480,9 @@ def _ensure_backend_user(user_id: str, silent: bool = False) -> bool:
     if st.session_state.get("backend_user_created", False) and not st.session_state.get("backend_user_id"):
         # 직접 요청으로 조회 시도
         try:
-            import requests
             get_url = f"{API_BASE_URL}/api/v1/users/"
             get_params = {"username": user_id}
-            get_response = requests.get(get_url, params=get_params, timeout=5)
+            get_response = _get_http_session().get(get_url, params=get_params, timeout=5)
             
             if get_response.status_code == 200:
                 users = get_response.json()
@@ -422,20 +516,18 @@ def _ensure_backend_user(user_id: str, silent: bool = False) -> bool:
     user_type = "guest" if user_id == ANONYMOUS_USER_ID or is_legacy_format else "user"
     
     # 비밀번호는 서버가 자동 생성할 수도 있으므로 일단 제외
-    # import secrets
-    # password = secrets.token_urlsafe(16)
+    # (필수 필드 누락 시에만 _get_session_password()로 세션당 1회 생성한 값을 사용)
     
     # 테스트 코드에서는 직접 requests.post()를 사용하여 성공했으므로,
     # 복잡한 재시도 로직을 우회하고 직접 요청을 먼저 시도
     # (테스트 코드와 동일한 방식으로 동작)
-    import requests
     response = None
     try:
         # 직접 POST 요청 시도 (테스트 코드와 동일)
         if not silent and API_SHOW_ERRORS:
             st.info("🔄 서버에 사용자 생성 요청 중...")
         
-        response = requests.post(url, json=payload, timeout=5)
+        response = _get_http_session().post(url, json=payload, timeout=5)
         
         if not silent and API_SHOW_ERRORS:
             st.info(f"📋 응답 코드: {response.status_code}")
@@ -477,7 +569,7 @@ def _ensure_backend_user(user_id: str, silent: bool = False) -> bool:
                     st.info(f"🔄 재시도 로직이 {response.status_code} 응답을 반환했습니다. 직접 요청을 재시도합니다...")
             
             # 직접 POST 요청 시도 (테스트 코드와 동일)
-            test_response = requests.post(url, json=payload, timeout=5)
+            test_response = _get_http_session().post(url, json=payload, timeout=5)
             
             if not silent and API_SHOW_ERRORS:
                 st.info(f"📋 직접 요청 재시도 응답 코드: {test_response.status_code}")
@@ -508,10 +600,10 @@ def _ensure_backend_user(user_id: str, silent: bool = False) -> bool:
                             "username": user_id,
                             "email": email,
                             "user_type": user_type,
-                            "password": secrets.token_urlsafe(16)  # 필수일 수 있으므로 추가
+                            "password": _get_session_password()  # 필수일 수 있으므로 추가
                         }
                         
-                        retry_response = requests.post(url, json=enhanced_payload, timeout=5)
+                        retry_response = _get_http_session().post(url, json=enhanced_payload, timeout=5)
                         if retry_response.status_code == 201:
                             data = retry_response.json()
                             server_user_id = data.get("user_id")
@@ -528,10 +620,9 @@ def _ensure_backend_user(user_id: str, silent: bool = False) -> bool:
                     
                     # username으로 조회 시도 (직접 요청으로)
                     try:
-                        import requests
                         get_url = f"{API_BASE_URL}/api/v1/users/"
                         get_params = {"username": user_id}
-                        get_response = requests.get(get_url, params=get_params, timeout=5)
+                        get_response = _get_http_session().get(get_url, params=get_params, timeout=5)
                         
                         if get_response.status_code == 200:
                             users = get_response.json()
@@ -558,12 +649,8 @@ def _ensure_backend_user(user_id: str, silent: bool = False) -> bool:
                     return False
             else:
                 if not silent and API_SHOW_ERRORS:
-                    try:
-                        error_data = test_response.json()
-                        st.error(f"❌ 직접 요청 응답 에러: {test_response.status_code}")
-                        st.json(error_data)
-                    except:
-                        st.error(f"❌ 직접 요청 응답 에러: {test_response.status_code} - {test_response.text[:200]}")
+                    st.error(f"❌ 직접 요청 응답 에러: {test_response.status_code}")
+                    _show_response_body(test_response)
                 return False
         except requests.ConnectionError as e:
             if not silent and API_SHOW_ERRORS:
@@ -608,10 +695,9 @@ def _ensure_backend_user(user_id: str, silent: bool = False) -> bool:
                 
                 # username으로 조회 시도 (직접 요청으로, _api_request_with_retry 사용하지 않음)
                 try:
-                    import requests
                     get_url = f"{API_BASE_URL}/api/v1/users/"
                     get_params = {"username": user_id}
-                    get_response = requests.get(get_url, params=get_params, timeout=5)
+                    get_response = _get_http_session().get(get_url, params=get_params, timeout=5)
                     
                     if get_response.status_code == 200:
                         users = get_response.json()
@@ -679,8 +765,6 @@ def _ensure_backend_user(user_id: str, silent: bool = False) -> bool:
             
             # 연결 테스트를 다시 시도해서 진단 정보 생성
             try:
-                import socket
-                from urllib.parse import urlparse
                 parsed = urlparse(url)
                 host = parsed.hostname
                 port = parsed.port or (80 if parsed.scheme == 'http' else 443)
@@ -708,14 +792,20 @@ def _ensure_backend_user(user_id: str, silent: bool = False) -> bool:
                         
                         # HTTP 연결 테스트
                         try:
-                            import requests
                             # Health check 엔드포인트 먼저 시도
+                            # ✅ 성능 개선: 본문을 받지 않는 HEAD + (연결, 읽기) 타임아웃 분리
+                            # - 죽은 호스트/포트는 2초 안에 실패, 응답 본문 다운로드 생략
+                            # - 연결 풀(_get_http_session) 재사용: 이어지는 진단 요청에서 연결 수립 비용 절감
                             health_url = f"{API_BASE_URL}/health"
                             try:
-                                health_response = requests.get(health_url, timeout=3)
+                                http = _get_http_session()
+                                health_response = http.head(health_url, timeout=(2, 3), allow_redirects=True)
+                                if health_response.status_code == 405:
+                                    # HEAD 미지원 서버: 본문을 읽지 않고 상태 코드만 확인 (GET의 405는 실패로 처리)
+                                    health_response = http.get(health_url, timeout=(2, 3), stream=True)
+                                    health_response.close()
                                 if health_response.status_code == 200:
-                                    diagnosis += f"✅ Health Check 성공: /health 엔드포인트 응답 정상\n"
-                                    diagnosis += f"   응답: {health_response.text[:100]}\n"
+                                    diagnosis += f"✅ Health Check 성공: /health 엔드포인트 응답 정상 ({health_response.status_code})\n"
                                 else:
                                     diagnosis += f"⚠️ Health Check 실패: /health 엔드포인트가 {health_response.status_code} 응답\n"
                             except Exception as health_e:
@@ -739,12 +829,11 @@ def _ensure_backend_user(user_id: str, silent: bool = False) -> bool:
                             
                             # POST 요청 테스트 (실제 사용자 생성 시도)
                             try:
-                                import secrets
                                 test_payload = {
                                     "email": f"test_{secrets.token_hex(8)}@example.com",
                                     "username": f"test_user_{secrets.token_hex(8)}",
                                     "user_type": "guest",
-                                    "password": secrets.token_urlsafe(16)
+                                    "password": _get_session_password()
                                 }
                                 post_response = requests.post(api_url, json=test_payload, timeout=5)
                                 diagnosis += f"\n📤 POST 요청 테스트: {api_url}\n"
@@ -753,26 +842,14 @@ def _ensure_backend_user(user_id: str, silent: bool = False) -> bool:
                                 if post_response.status_code == 201:
                                     diagnosis += "   ✅ POST 요청 성공! (사용자 생성 가능)\n"
                                 elif post_response.status_code == 400:
-                                    try:
-                                        error_data = post_response.json()
-                                        diagnosis += f"   ⚠️ 400 Bad Request: {str(error_data)[:200]}\n"
-                                    except:
-                                        diagnosis += f"   ⚠️ 400 Bad Request: {post_response.text[:200]}\n"
+                                    diagnosis += f"   ⚠️ 400 Bad Request: {_response_error_detail(post_response)[:200]}\n"
                                 elif post_response.status_code == 422:
-                                    try:
-                                        error_data = post_response.json()
-                                        diagnosis += f"   ❌ 422 Validation Error: {str(error_data)[:200]}\n"
-                                        diagnosis += "   💡 요청 본문의 필드가 서버 스키마와 맞지 않을 수 있습니다.\n"
-                                    except:
-                                        diagnosis += f"   ❌ 422 Validation Error: {post_response.text[:200]}\n"
+                                    diagnosis += f"   ❌ 422 Validation Error: {_response_error_detail(post_response)[:200]}\n"
+                                    diagnosis += "   💡 요청 본문의 필드가 서버 스키마와 맞지 않을 수 있습니다.\n"
                                 elif post_response.status_code == 401 or post_response.status_code == 403:
                                     diagnosis += "   ❌ 인증/권한 오류: 서버가 인증을 요구합니다.\n"
                                 else:
-                                    try:
-                                        error_data = post_response.json()
-                                        diagnosis += f"   ⚠️ 응답 코드 {post_response.status_code}: {str(error_data)[:200]}\n"
-                                    except:
-                                        diagnosis += f"   ⚠️ 응답 코드 {post_response.status_code}: {post_response.text[:200]}\n"
+                                    diagnosis += f"   ⚠️ 응답 코드 {post_response.status_code}: {_response_error_detail(post_response)[:200]}\n"
                             except requests.ConnectionError:
                                 diagnosis += f"\n❌ POST 요청 연결 실패\n"
                                 diagnosis += "   💡 GET은 성공하지만 POST가 실패합니다. 서버 설정 문제일 수 있습니다.\n"
@@ -841,10 +918,9 @@ def _ensure_backend_session() -> Optional[int]:
                     pass
             
             try:
-                import requests
                 get_url = f"{API_BASE_URL}/api/v1/users/"
                 get_params = {"username": user_id}
-                get_response = requests.get(get_url, params=get_params, timeout=5)
+                get_response = _get_http_session().get(get_url, params=get_params, timeout=5)
                 
                 if get_response.status_code == 200:
                     users = get_response.json()
@@ -869,7 +945,6 @@ def _ensure_backend_session() -> Optional[int]:
         context["source"] = st.session_state.get("source", "")
     
     # 세션 생성 요청 (테스트 코드와 동일하게 직접 요청 먼저 시도)
-    import requests
     response = None
     
     # 디버깅: 요청 정보 표시
@@ -890,17 +965,13 @@ def _ensure_backend_session() -> Optional[int]:
     
     try:
         # 직접 POST 요청 시도 (테스트 코드와 동일)
-        response = requests.post(url, json={"user_id": user_id, "context": context}, timeout=5)
+        response = _get_http_session().post(url, json={"user_id": user_id, "context": context}, timeout=5)
         
         if API_SHOW_ERRORS:
             try:
                 st.info(f"📋 세션 생성 응답 코드: {response.status_code}")
                 # 응답 본문 확인 (디버깅용)
-                try:
-                    response_data = response.json()
-                    st.json({"응답 코드": response.status_code, "응답 본문": response_data})
-                except:
-                    st.text(f"응답 본문 (텍스트): {response.text[:500]}")
+                _show_response_body(response, limit=500)
             except:
                 pass
         
@@ -981,13 +1052,11 @@ def _ensure_backend_session() -> Optional[int]:
         # user_id가 UUID 형식이면 로컬 user_id를 username으로 사용
         if not user_id.startswith("user_") and len(user_id) == 36:
             # UUID 형식이면 로컬 user_id를 가져와서 username으로 사용
-            from core.user import get_or_create_user_id
             local_user_id = get_or_create_user_id()
             if local_user_id and local_user_id.startswith("user_"):
                 original_user_id = local_user_id
         elif not user_id.startswith("user_"):
             # 이상한 형식이면 로컬 user_id 확인
-            from core.user import get_or_create_user_id
             local_user_id = get_or_create_user_id()
             if local_user_id:
                 original_user_id = local_user_id
@@ -995,7 +1064,6 @@ def _ensure_backend_session() -> Optional[int]:
         # 사용자 생성/조회 다시 시도 (최종 시도)
         # username으로 조회 시도 (이미 존재할 수 있음)
         try:
-            import requests
             get_url = f"{API_BASE_URL}/api/v1/users/"
             get_params = {"username": original_user_id}
             
@@ -1005,7 +1073,7 @@ def _ensure_backend_session() -> Optional[int]:
                 except:
                     pass
             
-            get_response = requests.get(get_url, params=get_params, timeout=5)
+            get_response = _get_http_session().get(get_url, params=get_params, timeout=5)
             
             if API_SHOW_ERRORS:
                 try:
@@ -1043,11 +1111,7 @@ def _ensure_backend_session() -> Optional[int]:
                 if API_SHOW_ERRORS:
                     try:
                         st.warning(f"⚠️ 사용자 조회 실패 (응답 코드: {get_response.status_code}). 사용자 생성 시도...")
-                        try:
-                            error_data = get_response.json()
-                            st.json(error_data)
-                        except:
-                            st.text(get_response.text[:200])
+                        _show_response_body(get_response)
                     except:
                         pass
                 
@@ -1071,7 +1135,6 @@ def _ensure_backend_session() -> Optional[int]:
             if API_SHOW_ERRORS:
                 try:
                     st.error(f"❌ 사용자 조회 실패: {str(e)}")
-                    import traceback
                     st.code(traceback.format_exc())
                 except:
                     pass
@@ -1084,23 +1147,18 @@ def _ensure_backend_session() -> Optional[int]:
                 pass
         
         try:
-            response = requests.post(url, json={"user_id": user_id, "context": context}, timeout=5)
+            response = _get_http_session().post(url, json={"user_id": user_id, "context": context}, timeout=5)
             if API_SHOW_ERRORS:
                 try:
                     st.info(f"📋 세션 생성 재시도 응답 코드: {response.status_code}")
                     if response.status_code != 201:
-                        try:
-                            error_data = response.json()
-                            st.json(error_data)
-                        except:
-                            st.text(response.text[:200])
+                        _show_response_body(response)
                 except:
                     pass
         except Exception as e:
             if API_SHOW_ERRORS:
                 try:
                     st.error(f"❌ 세션 생성 재시도 실패: {str(e)}")
-                    import traceback
                     st.code(traceback.format_exc())
                 except:
                     pass
@@ -1194,10 +1252,7 @@ def _log_news_interaction(news_id: str, interaction_type: str, original_event_na
         return True, None
     
     # 에러 응답 파싱 및 로깅
-    try:
-        error_detail = response.json().get("detail", response.text[:200])
-    except:
-        error_detail = response.text[:200] if response.text else "알 수 없는 오류"
+    error_detail = _response_error_detail(response)
     
     _log_api_error("뉴스 상호작용 로깅 실패", response)
     
@@ -1246,7 +1301,6 @@ def _log_dialogue(sender_type: str, content: str, intent: Optional[str] = None)
                                         }
                                         supabase.table("users").insert(user_insert).execute()
                                         user_exists = True
-                                        import time
                                         time.sleep(0.1)  # FK 제약 반영 대기
                                     except Exception:
                                         # 사용자 생성 실패해도 조용히 처리
@@ -1256,7 +1310,6 @@ def _log_dialogue(sender_type: str, content: str, intent: Optional[str] = None)
                                 if user_exists:
                                     try:
                                         session_token = str(uuid.uuid4())
-                                        from datetime import timedelta
                                         expires_at = datetime.now(timezone.utc) + timedelta(days=30)
                                         session_insert = {
                                             "user_id": user_id,
@@ -1344,7 +1397,6 @@ def _log_dialogue(sender_type: str, content: str, intent: Optional[str] = None)
                 # Supabase 에러는 항상 표시 (API_SHOW_ERRORS와 독립적)
                 try:
                     st.error(f"⚠️ Supabase dialogue 삽입 실패: {error_msg}")
-                    import traceback
                     st.error(f"상세 에러:\n{traceback.format_exc()}")
                 except:
                     pass
@@ -1396,10 +1448,7 @@ def _log_dialogue(sender_type: str, content: str, intent: Optional[str] = None)
         return data.get("dialogue_id"), None
     
     # 에러 응답 파싱 및 로깅
-    try:
-        error_detail = response.json().get("detail", response.text[:200])
-    except:
-        error_detail = response.text[:200] if response.text else "알 수 없는 오류"
+    error_detail = _response_error_detail(response)
     
     _log_api_error("대화 생성 실패", response)
     
@@ -1477,10 +1526,7 @@ def _update_session_context(**kwargs) -> Tuple[bool, Optional[str]]:
         return True, None
     
     # 에러 응답 파싱
-    try:
-        error_detail = response.json().get("detail", response.text[:200])
-    except:
-        error_detail = response.text[:200] if response.text else "알 수 없는 오류"
+    error_detail = _response_error_detail(response)
     
     # 에러 응답 로깅 (디버깅용)
     if API_SHOW_ERRORS:
@@ -1499,9 +1545,11 @@ def _update_session_context(**kwargs) -> Tuple[bool, Optional[str]]:
 def _log_to_event_log(event_name: str, **kwargs) -> Tuple[bool, Optional[str]]:
     """
     event_log 테이블에 직접 이벤트를 기록합니다 (로그 중심 DB)
+    - 행은 배치 버퍼에 쌓였다가 _flush_event_log_buffer()에서 한 번에 insert 됩니다.
     
     Returns:
         (success: bool, error_info: Optional[str])
+        버퍼에만 추가된 경우 (True, None)
     """
     supabase = get_supabase_client()
     if not supabase:
@@ -1626,81 +1674,267 @@ def _log_to_event_log(event_name: str, **kwargs) -> Tuple[bool, Optional[str]]:
     if ref_id:
         insert_data["ref_id"] = ref_id
     
-    try:
-        response = supabase.table("event_logs").insert(insert_data).execute()
+    # ✅ 성능 개선: 이벤트마다 insert 하지 않고 버퍼에 모아 한 번에 배치 insert
+    return _enqueue_event_log_row(insert_data)
+
+
+# ─────────────────────────────────────────────────────────────
+# event_logs 배치 삽입 버퍼
+# ─────────────────────────────────────────────────────────────
+EVENT_LOG_BATCH_SIZE = 8          # 이만큼 쌓이면 즉시 flush
+EVENT_LOG_FLUSH_INTERVAL = 2.0    # 첫 이벤트가 쌓인 뒤 이 시간(초)이 지나면 flush
+
+_event_log_buffer: list = []
+_event_log_buffer_lock = threading.Lock()
+_event_log_flush_timer: Optional[threading.Timer] = None
+
+
+def _enqueue_event_log_row(insert_data: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    """event_logs 행을 버퍼에 추가하고, 임계치에 도달하면 바로 flush"""
+    global _event_log_flush_timer
+    with _event_log_buffer_lock:
+        _event_log_buffer.append(insert_data)
+        should_flush = len(_event_log_buffer) >= EVENT_LOG_BATCH_SIZE
+        if not should_flush and _event_log_flush_timer is None:
+            # 이벤트가 뜸해도 EVENT_LOG_FLUSH_INTERVAL 안에는 반드시 기록되도록 타이머 예약
+            _event_log_flush_timer = threading.Timer(EVENT_LOG_FLUSH_INTERVAL, _flush_event_log_buffer)
+            _event_log_flush_timer.daemon = True
+            _event_log_flush_timer.start()
+
+    if should_flush:
+        return _flush_event_log_buffer()
+    return True, None
+
+
+def _flush_event_log_buffer() -> Tuple[bool, Optional[str]]:
+    """버퍼에 쌓인 event_logs 행을 컬럼 구성별 배치 insert로 기록 (실패한 배치는 행 단위 재시도)"""
+    global _event_log_flush_timer
+    with _event_log_buffer_lock:
+        rows = list(_event_log_buffer)
+        _event_log_buffer.clear()
+        if _event_log_flush_timer is not None:
+            _event_log_flush_timer.cancel()
+            _event_log_flush_timer = None
+
+    if not rows:
         return True, None
+
+    supabase = get_supabase_client()
+    if not supabase:
+        return False, "Supabase 클라이언트를 사용할 수 없습니다"
+
+    # 배치 insert는 모든 행의 컬럼 구성이 같아야 하므로 컬럼 구성(키 집합)별로 묶어서 insert
+    # (없는 필드를 None으로 채우면 명시적 NULL이 들어가 DB 컬럼 기본값/NOT NULL 제약을 깨뜨림)
+    groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault(tuple(sorted(row)), []).append(row)
+
+    first_error: Optional[str] = None
+    for group_rows in groups.values():
+        error_msg = _insert_event_log_rows(supabase, group_rows)
+        if error_msg and first_error is None:
+            first_error = error_msg
+    return first_error is None, first_error
+
+
+def _insert_event_log_rows(supabase, rows: List[Dict[str, Any]]) -> Optional[str]:
+    """
+    같은 컬럼 구성의 event_logs 행들을 배치 insert (실패 시 행 단위로 재시도)
+    - 배치 하나가 실패해도 다른 사용자/세션의 정상 행까지 버려지지 않도록 한 행씩 다시 기록하고,
+      그래도 실패한 행만 서버 로그로 보고
+    - 타이머 스레드에서 호출될 수 있어 st.warning은 사용자에게 닿지 않으므로 print로 기록
+    - 반환: 실패가 있으면 첫 에러 메시지, 모두 성공하면 None
+    """
+    try:
+        supabase.table("event_logs").insert(rows).execute()
+        return None
     except Exception as e:
-        error_msg = str(e)
-        # Supabase 에러는 SUPABASE_ENABLE이 True일 때 항상 표시 (API 설정과 무관)
-        if SUPABASE_ENABLE:
-            try:
-                st.warning(f"⚠️ Supabase event_log 삽입 실패 ({event_name}): {error_msg}")
-            except:
-                pass
-        return False, error_msg
+        if len(rows) == 1:
+            _report_event_log_failure(rows[0], str(e))
+            return str(e)
+
+    first_error: Optional[str] = None
+    for row in rows:
+        try:
+            supabase.table("event_logs").insert(row).execute()
+        except Exception as e:
+            _report_event_log_failure(row, str(e))
+            if first_error is None:
+                first_error = str(e)
+    return first_error
+
+
+def _report_event_log_failure(row: Dict[str, Any], error_msg: str) -> None:
+    """event_logs 행 삽입 실패를 서버 로그에 기록 (Supabase 에러는 SUPABASE_ENABLE이 True일 때 항상 표시)"""
+    if SUPABASE_ENABLE:
+        print(
+            f"⚠️ Supabase event_log 삽입 실패 "
+            f"(event={row.get('event_name')}, user={row.get('user_id')}, session={row.get('session_id')}): {error_msg}"
+        )
+
+
+# 프로세스 종료 시 남은 이벤트 기록
+atexit.register(_flush_event_log_buffer)
+
+
+# ─────────────────────────────────────────────────────────────
+# CSV 로그 쓰기 버퍼
+# ─────────────────────────────────────────────────────────────
+CSV_LOG_BATCH_SIZE = 32           # 이만큼 쌓이면 즉시 flush
+CSV_LOG_FLUSH_INTERVAL = 1.0      # 첫 행이 쌓인 뒤 이 시간(초)이 지나면 flush
+
+_csv_log_buffer: deque = deque()
+_csv_log_buffer_lock = threading.Lock()
+_csv_log_write_lock = threading.Lock()
+_csv_log_flush_timer: Optional[threading.Timer] = None
+
+
+def _enqueue_csv_rows(rows: List[Dict[str, Any]]) -> None:
+    """CSV 행들을 버퍼에 추가하고, 임계치에 도달하면 백그라운드에서 flush"""
+    global _csv_log_flush_timer
+    with _csv_log_buffer_lock:
+        _csv_log_buffer.extend(rows)
+        if len(_csv_log_buffer) >= CSV_LOG_BATCH_SIZE:
+            delay = 0.0
+        elif _csv_log_flush_timer is None:
+            delay = CSV_LOG_FLUSH_INTERVAL
+        else:
+            return
+        if _csv_log_flush_timer is not None:
+            _csv_log_flush_timer.cancel()
+        # 파일 쓰기는 데몬 타이머 스레드에서 수행 (클릭 핸들러는 파일 I/O를 기다리지 않음)
+        _csv_log_flush_timer = threading.Timer(delay, _flush_csv_log_buffer)
+        _csv_log_flush_timer.daemon = True
+        _csv_log_flush_timer.start()
+
+
+def _flush_csv_log_buffer() -> None:
+    """버퍼에 쌓인 CSV 행을 파일을 한 번만 열어 writerows로 기록"""
+    global _csv_log_flush_timer
+    with _csv_log_buffer_lock:
+        rows = list(_csv_log_buffer)
+        _csv_log_buffer.clear()
+        if _csv_log_flush_timer is not None:
+            _csv_log_flush_timer.cancel()
+            _csv_log_flush_timer = None
+
+    if not rows:
+        return
+
+    # 타이머 스레드와 atexit flush가 겹쳐도 행이 섞이지 않도록 쓰기 자체를 직렬화
+    with _csv_log_write_lock:
+        try:
+            ensure_log_file()
+            with open(LOG_FILE, "a", encoding="utf-8-sig", newline="") as f:
+                writer = csv.DictWriter(
+                    f,
+                    fieldnames=CSV_HEADER,
+                    quoting=csv.QUOTE_MINIMAL,
+                    extrasaction="ignore"
+                )
+                writer.writerows(rows)
+        except Exception:
+            # 로그 기록 실패가 앱 동작을 막지 않도록 조용히 무시
+            pass
+
+
+# 프로세스 종료 시 남은 CSV 행 기록
+atexit.register(_flush_csv_log_buffer)
 
 
 # ─────────────────────────────────────────────────────────────
 # 기존 로깅 함수 (CSV + API + event_log)
 # ─────────────────────────────────────────────────────────────
 
+def _build_csv_row(event_name: str, **kwargs) -> Dict[str, Any]:
+    """CSV 한 행 구성 (session_state를 읽으므로 메인 스레드에서 호출)"""
+    return {
+        # ================== 기본 메타 정보 ==================
+        "event_id": str(uuid.uuid4()),
+        "event_time": now_utc_iso(),                     # 🕓 이벤트 발생 시각 (UTC 기준, ISO 포맷)
+        "event_name": event_name,                        # 🏷️ 이벤트 이름 (예: "news_click", "chat_question")
+
+        # ================== 사용자/세션 정보 ==================
+        "user_id": _get_user_id(),   # 👤 유저 식별자 (서버 UUID 우선 사용, CSV와 API 동일)
+        "session_id": st.session_state.get("session_id", ""), # 💬 세션 식별자 (브라우저 새로고침마다 유지됨)
+
+        # ================== UI 위치/출처 정보 ==================
+        "surface": _nz(kwargs.get("surface", "")),       # 🧭 화면 구역 (예: "home", "detail", "sidebar")
+        "source":  _nz(kwargs.get("source", "")),        # 🧩 이벤트가 발생한 세부 위치 (예: "chat", "list", "term_box")
+
+        # ================== 콘텐츠 식별자 ==================
+        "news_id": _nz(kwargs.get("news_id", "")),       # 📰 클릭/요약된 뉴스의 고유 ID
+        "term":    _nz(kwargs.get("term", "")),          # 💡 클릭한 금융용어 (예: "양적완화")
+
+        # ================== 사용자 입력/노트 관련 ==================
+        "message": _as_json_text(kwargs.get("message", "")),  # 💬 사용자가 입력한 메시지 (챗봇 질문 등)
+        "note":    _nz(kwargs.get("note", "")),               # 🗒️ 임시 메모/추가 코멘트
+        "title":   _nz(kwargs.get("title", "")),              # 🏷️ 뉴스나 카드의 제목 (클릭된 항목 표시용)
+        "click_count": _nz(kwargs.get("click_count", "")),    # 🔢 특정 UI 요소 클릭 횟수 (실험용)
+
+        # ================== 챗봇 응답/성능 메타 ==================
+        "answer_len": _nz(kwargs.get("answer_len", "")),      # 📏 챗봇 응답 길이 (토큰/문자 수)
+        "via":        _nz(kwargs.get("via", "")),             # ⚙️ 사용된 모델 혹은 라우팅 경로 (예: "openai", "mock")
+        "latency_ms": _nz(kwargs.get("latency_ms", "")),      # ⏱️ 응답 지연 시간(ms 단위)
+
+        # ================== 추가 정보(JSON) ==================
+        "payload": _as_json_text(kwargs.get("payload", {})),
+        # 📦 상세 데이터(JSON 형태로 저장)
+        # 예시: {"browser": "Chrome", "os": "Windows", "ref": "sidebar-term", "exp_group": "A"}
+    }
+
+
+def _split_glossary_interaction(kwargs: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    glossary_interaction 이벤트를 서버용 glossary_click → glossary_answer 순서의 두 이벤트로 분해
+    - click: 사용자 자동 질문(message) + 클릭 횟수 + 전체 처리 시간(latency_ms)
+    - answer: 설명 응답(response) + 답변 길이 + 설명 생성 시간(payload.perf_steps.explanation_ms)
+      (rag_info는 호출부가 payload에만 넣으므로 payload에서 꺼내 답변 이벤트 인자로 전달)
+    """
+    payload = kwargs.get("payload") or {}
+    common = {
+        k: kwargs[k]
+        for k in ("term", "news_id", "source", "surface", "message", "_captured_user_id")
+        if k in kwargs
+    }
+    click_kwargs = dict(
+        common,
+        click_count=kwargs.get("click_count"),
+        latency_ms=kwargs.get("latency_ms"),
+        payload=payload,
+    )
+    answer_kwargs = dict(
+        common,
+        answer_len=kwargs.get("answer_len"),
+        latency_ms=(payload.get("perf_steps") or {}).get("explanation_ms", kwargs.get("latency_ms")),
+        via=kwargs.get("via"),
+        rag_info=kwargs.get("rag_info", payload.get("rag_info")),
+        response=kwargs.get("response"),
+        payload=payload,
+    )
+    return [("glossary_click", click_kwargs), ("glossary_answer", answer_kwargs)]
+
+
 def _log_event_sync(event_name: str, **kwargs):
     """
     로깅 함수의 동기 실행 부분 (CSV 저장 등)
     """
     # CSV 저장 (선택적 - 서버 중심 모드에서는 비활성화)
     if CSV_ENABLE:
-        ensure_log_file()
-        row = {
-            # ================== 기본 메타 정보 ==================
-            "event_id": str(uuid.uuid4()),
-            "event_time": now_utc_iso(),                     # 🕓 이벤트 발생 시각 (UTC 기준, ISO 포맷)
-            "event_name": event_name,                        # 🏷️ 이벤트 이름 (예: "news_click", "chat_question")
-
-            # ================== 사용자/세션 정보 ==================
-            "user_id": _get_user_id(),   # 👤 유저 식별자 (서버 UUID 우선 사용, CSV와 API 동일)
-            "session_id": st.session_state.get("session_id", ""), # 💬 세션 식별자 (브라우저 새로고침마다 유지됨)
-
-            # ================== UI 위치/출처 정보 ==================
-            "surface": _nz(kwargs.get("surface", "")),       # 🧭 화면 구역 (예: "home", "detail", "sidebar")
-            "source":  _nz(kwargs.get("source", "")),        # 🧩 이벤트가 발생한 세부 위치 (예: "chat", "list", "term_box")
-
-            # ================== 콘텐츠 식별자 ==================
-            "news_id": _nz(kwargs.get("news_id", "")),       # 📰 클릭/요약된 뉴스의 고유 ID
-            "term":    _nz(kwargs.get("term", "")),          # 💡 클릭한 금융용어 (예: "양적완화")
-
-            # ================== 사용자 입력/노트 관련 ==================
-            "message": _as_json_text(kwargs.get("message", "")),  # 💬 사용자가 입력한 메시지 (챗봇 질문 등)
-            "note":    _nz(kwargs.get("note", "")),               # 🗒️ 임시 메모/추가 코멘트
-            "title":   _nz(kwargs.get("title", "")),              # 🏷️ 뉴스나 카드의 제목 (클릭된 항목 표시용)
-            "click_count": _nz(kwargs.get("click_count", "")),    # 🔢 특정 UI 요소 클릭 횟수 (실험용)
-
-            # ================== 챗봇 응답/성능 메타 ==================
-            "answer_len": _nz(kwargs.get("answer_len", "")),      # 📏 챗봇 응답 길이 (토큰/문자 수)
-            "via":        _nz(kwargs.get("via", "")),             # ⚙️ 사용된 모델 혹은 라우팅 경로 (예: "openai", "mock")
-            "latency_ms": _nz(kwargs.get("latency_ms", "")),      # ⏱️ 응답 지연 시간(ms 단위)
-
-            # ================== 추가 정보(JSON) ==================
-            "payload": _as_json_text(kwargs.get("payload", {})),
-            # 📦 상세 데이터(JSON 형태로 저장)
-            # 예시: {"browser": "Chrome", "os": "Windows", "ref": "sidebar-term", "exp_group": "A"}
-        }
-
-        # DictWriter로 CSV에 한 줄씩 기록
-        with open(LOG_FILE, "a", encoding="utf-8-sig", newline="") as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=CSV_HEADER,
-                quoting=csv.QUOTE_MINIMAL,
-                extrasaction="ignore"
-            )
-            writer.writerow(row)
+        # ✅ 성능 개선: 이벤트마다 파일을 열지 않고 버퍼에 모아 한 번에 기록
+        _enqueue_csv_rows([_build_csv_row(event_name, **kwargs)])
 
 
 def _log_event_async(event_name: str, **kwargs):
     """
     로깅 함수의 비동기 실행 부분 (Supabase, API 호출 등)
     """
+    # 통합 용어 이벤트는 서버 스키마에 맞춰 기존 클릭/답변 이벤트로 나눠 처리
+    if event_name == GLOSSARY_INTERACTION_EVENT:
+        for legacy_name, legacy_kwargs in _split_glossary_interaction(kwargs):
+            _log_event_async(legacy_name, **legacy_kwargs)
+        return
+
     # 🎯 대화 관련 이벤트는 dialogue 생성이 필요하므로 먼저 처리
     # (dialogue_id가 생성된 후 event_log에 기록되어야 함)
     dialogue_events = ("chat_question", "chat_answer", "chat_response", "glossary_answer", "glossary_click")
@@ -1766,23 +2000,34 @@ def _log_event_async(event_name: str, **kwargs):
             st.session_state["api_send_status"]["failed"] += 1
 
 
+def is_logging_enabled() -> bool:
+    """
+    이벤트를 실제로 기록할 싱크(CSV / Supabase / API)가 하나라도 켜져 있는지
+    - 호출부에서 로그 payload(성능 측정 dict 등) 구성 자체를 건너뛸 때 사용
+    """
+    return bool(CSV_ENABLE or SUPABASE_ENABLE or (API_ENABLE and REQUESTS_AVAILABLE))
+
+
 def log_event(event_name: str, **kwargs):
     """
     로깅 함수 (서버 중심 모드, 비동기 최적화)
     --------------------------------------------------------
     ✅ 역할:
         - 사용자의 행동(이벤트)을 서버 API로 기록합니다.
-        - CSV는 동기적으로 저장 (CSV_ENABLE=True일 때만)
-        - Supabase/API 호출은 비동기로 실행하여 UI 블로킹 방지
+        - CSV는 버퍼에 모아 배치로 저장 (CSV_ENABLE=True일 때만)
+        - Supabase/API 호출은 백그라운드 로깅 워커(큐)에서 실행하여 UI 블로킹 방지
         - 예: 뉴스 클릭, 용어 클릭, 챗봇 질문 등
     --------------------------------------------------------
     """
-    # CSV 저장은 동기적으로 실행 (빠른 로컬 파일 I/O)
+    # ✅ 성능 개선: 기록할 곳이 없으면 CSV 행 구성/딥카피/큐 전달을 모두 생략
+    if not is_logging_enabled():
+        return
+
+    # CSV 행 구성은 메인 스레드에서 (session_state 접근), 파일 쓰기는 버퍼 flush 시 일괄 처리
     _log_event_sync(event_name, **kwargs)
 
     # ✅ 성능 개선: Supabase/API 호출은 비동기로 실행 (UI 블로킹 방지)
     # kwargs를 딥카피하여 스레드 안전성 보장
-    import copy
     kwargs_copy = copy.deepcopy(kwargs)
 
     # ⚠️ 중요: 스레드에서는 session_state에 접근할 수 없으므로
@@ -1790,14 +2035,133 @@ def log_event(event_name: str, **kwargs):
     if "_captured_user_id" not in kwargs_copy:
         kwargs_copy["_captured_user_id"] = _get_user_id()
 
-    # 백그라운드 스레드에서 실행
-    thread = threading.Thread(
-        target=_log_event_async,
-        args=(event_name,),
-        kwargs=kwargs_copy,
-        daemon=True
-    )
-    thread.start()
+    # 백그라운드 로깅 워커 큐에 전달 (이벤트마다 스레드를 새로 만들지 않음)
+    _submit_log_events([(event_name, kwargs_copy)])
+
+
+def _log_events_async(events: List[Tuple[str, Dict[str, Any]]]):
+    """여러 이벤트를 한 스레드에서 순서대로 처리 (예: glossary_click → glossary_answer)"""
+    for event_name, kwargs in events:
+        _log_event_async(event_name, **kwargs)
+
+
+def log_events(rows: List[Dict[str, Any]]):
+    """
+    한 번의 상호작용에서 발생한 여러 이벤트를 한꺼번에 기록
+    --------------------------------------------------------
+    ✅ 역할:
+        - rows: {"event_name": ..., **log_event와 같은 kwargs} 딕셔너리 목록
+        - CSV 행은 한 번에 버퍼에 추가 (CSV_ENABLE=True일 때만)
+        - Supabase/API 호출은 백그라운드 로깅 워커에서 입력 순서대로 실행
+          (dialogue 생성 순서도 보장)
+    --------------------------------------------------------
+    """
+    if not rows or not is_logging_enabled():
+        return
+
+    events = [(row["event_name"], {k: v for k, v in row.items() if k != "event_name"}) for row in rows]
+
+    if CSV_ENABLE:
+        _enqueue_csv_rows([_build_csv_row(event_name, **kwargs) for event_name, kwargs in events])
+
+    # 스레드에서는 session_state에 접근할 수 없으므로 user_id를 한 번만 미리 캡처
+    captured_user_id = _get_user_id()
+    events_copy = []
+    for event_name, kwargs in events:
+        kwargs_copy = copy.deepcopy(kwargs)
+        kwargs_copy.setdefault("_captured_user_id", captured_user_id)
+        events_copy.append((event_name, kwargs_copy))
+
+    _submit_log_events(events_copy)
+
+
+# ─────────────────────────────────────────────────────────────
+# 백그라운드 로깅 워커 (Supabase/API 전송)
+# ─────────────────────────────────────────────────────────────
+LOG_WORKER_COUNT = 4              # 동시에 Supabase/API 전송을 처리하는 워커 스레드 수
+LOG_QUEUE_MAXSIZE = 10000         # 전체 대기 이벤트 묶음 수 상한 (워커별로 나눠 가짐)
+
+# 워커마다 자기 큐를 가짐: 같은 사용자의 이벤트는 항상 같은 워커로 보내 기록 순서를 유지하고,
+# 한 워커가 느린 백엔드 호출(타임아웃/재시도)에 묶여도 다른 사용자의 로깅은 나머지 워커가 처리
+_log_queues: List["queue.Queue[List[Tuple[str, Dict[str, Any]]]]"] = [
+    queue.Queue(maxsize=max(1, LOG_QUEUE_MAXSIZE // LOG_WORKER_COUNT)) for _ in range(LOG_WORKER_COUNT)
+]
+_log_workers: List[Optional[threading.Thread]] = [None] * LOG_WORKER_COUNT
+_log_worker_lock = threading.Lock()
+_log_dropped_count = 0
+
+
+def _log_queue_worker(log_queue: "queue.Queue[List[Tuple[str, Dict[str, Any]]]]"):
+    """자기 큐에 들어온 이벤트 묶음을 순서대로 처리하는 데몬 스레드"""
+    while True:
+        events = log_queue.get()
+        try:
+            _log_events_async(events)
+        except Exception:
+            # 로깅 실패가 워커를 멈추지 않도록 조용히 무시
+            pass
+        finally:
+            log_queue.task_done()
+
+
+def get_dropped_log_event_count() -> int:
+    """로깅 큐가 가득 차서 버려진 이벤트 묶음 수 (프로세스 누적)"""
+    return _log_dropped_count
+
+
+def _submit_log_events(events: List[Tuple[str, Dict[str, Any]]]) -> None:
+    """
+    이벤트 묶음을 백그라운드 워커 큐에 넣음
+    ✅ 성능 개선: 클릭마다 스레드를 생성하지 않고 고정된 수(LOG_WORKER_COUNT)의 워커가 처리
+    - 사용자 ID로 워커를 골라 같은 사용자의 이벤트 순서는 유지
+    - 큐가 가득 차면 이벤트를 버리고 누적 카운터를 올린 뒤 서버 로그에 남김 (조용히 유실하지 않음)
+    """
+    global _log_dropped_count
+    user_id = (events[0][1].get("_captured_user_id") if events else None) or ""
+    shard = hash(user_id) % LOG_WORKER_COUNT
+
+    with _log_worker_lock:
+        worker = _log_workers[shard]
+        if worker is None or not worker.is_alive():
+            worker = threading.Thread(
+                target=_log_queue_worker,
+                args=(_log_queues[shard],),
+                name=f"event-log-worker-{shard}",
+                daemon=True,
+            )
+            worker.start()
+            _log_workers[shard] = worker
+
+    try:
+        _log_queues[shard].put_nowait(events)
+    except queue.Full:
+        with _log_worker_lock:
+            _log_dropped_count += 1
+            dropped = _log_dropped_count
+        # 로그 폭주 방지: 첫 유실과 이후 100건마다 한 번씩만 출력
+        if dropped == 1 or dropped % 100 == 0:
+            event_names = ", ".join(name for name, _ in events)
+            print(f"⚠️ 로깅 큐가 가득 차 이벤트를 버렸습니다 ({event_names}) - 누적 {dropped:,}건")
+
+
+def _drain_log_queue():
+    """프로세스 종료 시 아직 처리되지 않은 이벤트를 현재 스레드에서 마저 처리"""
+    for log_queue in _log_queues:
+        while True:
+            try:
+                events = log_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                _log_events_async(events)
+            except Exception:
+                pass
+            finally:
+                log_queue.task_done()
+
+
+# 프로세스 종료 시 남은 이벤트 처리 (event_logs 버퍼 flush보다 먼저 실행되도록 나중에 등록)
+atexit.register(_drain_log_queue)
 
 
 def _parse_message(message: str) -> str:
@@ -2144,9 +2508,9 @@ def log_scroll_depth(depth_pct: float):
 def start_view_timer(news_id: str):
     """
     뉴스 상세 보기 시작 시 호출.
-    st.session_state에 시작 시간을 저장합니다.
+    st.session_state에 시작 시각(단조 시계 perf_counter_ns)을 저장합니다.
     """
-    st.session_state["view_start_time"] = time.time()
+    st.session_state["view_start_ns"] = time.perf_counter_ns()
     st.session_state["view_news_id"] = news_id
     st.session_state["detail_max_depth_pct"] = 0.0
 
@@ -2156,8 +2520,8 @@ def end_view_timer():
     뉴스 상세 보기 종료 시 호출.
     체류시간(duration_sec) + max_depth_pct를 payload을 계산하여 로그로 남깁니다.
     """
-    if "view_start_time" in st.session_state:
-        duration_sec = time.time() - st.session_state["view_start_time"]
+    if "view_start_ns" in st.session_state:
+        duration_sec = (time.perf_counter_ns() - st.session_state["view_start_ns"]) / 1e9
         news_id = st.session_state.get("view_news_id", None)
         max_depth = st.session_state.get("detail_max_depth_pct", 0.0)
         payload = {
@@ -2172,7 +2536,7 @@ def end_view_timer():
             payload=payload
         )
         # 세션 초기화
-        for k in ("view_start_time", "view_news_id", "detail_max_depth_pct"):
+        for k in ("view_start_ns", "view_news_id", "detail_max_depth_pct"):
             if k in st.session_state:
                 del st.session_state[k]
 
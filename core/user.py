@@ -105,6 +105,26 @@ def get_or_create_user_id() -> str:
 # ─────────────────────────────────────────────────────────────
 # 🧩 (4) 세션 및 유저 초기화
 # ─────────────────────────────────────────────────────────────
+# 세션 상태 기본값 (값이 callable이면 세션마다 새 객체 생성 — 리스트 공유 방지)
+SESSION_STATE_DEFAULTS = {
+    "selected_article": None,
+    "chat_history": list,
+    "term_click_count": 0,
+    "news_click_count": 0,
+    "chat_count": 0,
+    "detail_enter_logged": False,
+    "news_articles": list,
+    "page_enter_time_ns": None,   # 페이지 입장 시각 (time.perf_counter_ns)
+}
+
+
+def ensure_session_defaults():
+    """세션 상태 기본값을 한 번에 채웁니다 (이미 있는 값은 유지)"""
+    for key, default in SESSION_STATE_DEFAULTS.items():
+        if key not in st.session_state:
+            st.session_state[key] = default() if callable(default) else default
+
+
 def init_session_and_user():
     """
     🚀 Streamlit 세션 시작 시 기본 상태를 초기화합니다.
@@ -122,9 +142,8 @@ def init_session_and_user():
     user_id = get_or_create_user_id()
     st.session_state.user_id = user_id
 
-    # 부가 상태값 초기화
-    st.session_state.setdefault("page_enter_time", None)  # 페이지 입장 시각
-    st.session_state.setdefault("term_click_count", 0)    # 용어 클릭 횟수 누적
+    # 부가 상태값 초기화 (페이지 입장 시각, 용어 클릭 횟수, 채팅 이력 등)
+    ensure_session_defaults()
 
 
 # ─────────────────────────────────────────────────────────────
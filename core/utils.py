@@ -1,15 +1,23 @@
 import os
+import io
 import csv
 import json
 import uuid
 import re
 import pandas as pd
+from pandas.api.types import union_categoricals
 import streamlit as st
 from datetime import datetime, timezone
 from core.config import LOG_DIR, LOG_FILE
-from openai import OpenAI
 from core.logger import CSV_HEADER
 
+# pyarrow (선택 의존성: streamlit 설치 시 함께 설치됨)
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 # ─────────────────────────────────────────────────────────────
 # 🕓 (1) 현재 UTC 시각을 ISO 형식 문자열로 반환
 # ─────────────────────────────────────────────────────────────
@@ -41,6 +49,88 @@ def ensure_log_file():
 # ─────────────────────────────────────────────────────────────
 # 🧾 (3) 로그 CSV 파일을 DataFrame으로 로드
 # ─────────────────────────────────────────────────────────────
+# 반복값이 많아 category(사전 인코딩)로 다루는 로그 컬럼
+_LOG_CATEGORY_COLUMNS = ["event_name", "surface", "source", "user_id", "session_id", "term"]
+
+# 로그 뷰어에서 보기 쉬운 컬럼 순서
+_LOG_ORDER_COLUMNS = [
+    "event_id",
+    "event_time",
+    "event_name",
+    "user_id",
+    "session_id",
+    "surface",
+    "source",
+    "news_id",
+    "term",
+    "message",
+    "note",
+    "title",
+    "click_count",
+    "answer_len",
+    "via",
+    "latency_ms",
+    "payload",  # ✅ 그대로 유지
+]
+
+
+def _read_log_csv(data: bytes, names: list | None = None) -> pd.DataFrame:
+    """
+    CSV 바이트를 문자열 DataFrame으로 파싱합니다.
+    - ✅ 성능 개선: pyarrow가 있으면 멀티스레드 Arrow 파서로 읽고 문자열 컬럼을 Arrow 문자열로 보관
+      (object 대비 메모리 감소, 문자열 연산/비교가 벡터화됨)
+    - 그 외에는 C 파서로 먼저 읽고, 실패할 때만 느린 python 엔진으로 재시도
+    - names가 주어지면 헤더 없는 조각(파일 뒷부분)으로 보고 해당 컬럼명을 사용합니다.
+    """
+    options = dict(on_bad_lines="skip")
+    if names is not None:
+        options.update(header=None, names=names)
+
+    if PYARROW_AVAILABLE:
+        try:
+            return pd.read_csv(
+                io.BytesIO(data.removeprefix(b"\xef\xbb\xbf")),  # UTF-8 BOM 제거
+                engine="pyarrow",
+                dtype="string[pyarrow]",
+                encoding="utf-8",
+                **options,
+            )
+        except (pd.errors.ParserError, UnicodeDecodeError, ValueError, TypeError):
+            pass  # 구버전 pandas 미지원 옵션/깨진 줄 등 → 아래 파서로 재시도
+
+    options.update(dtype=str, encoding="utf-8-sig")
+    try:
+        return pd.read_csv(io.BytesIO(data), engine="c", **options)
+    except (pd.errors.ParserError, UnicodeDecodeError, ValueError):
+        return pd.read_csv(io.BytesIO(data), engine="python", **options)
+
+
+def _normalize_log_df(df: pd.DataFrame) -> pd.DataFrame:
+    """파싱된 원본 로그 DataFrame의 컬럼/타입/정렬을 뷰어용으로 정리합니다."""
+    # 1️⃣ 표준 컬럼 보장 (없는 경우 빈 컬럼으로 채움)
+    for col in CSV_HEADER:
+        if col not in df.columns:
+            df[col] = ""
+
+    # 2️⃣ event_time 문자열 → datetime 변환 (UTC 기준)
+    df["event_time"] = pd.to_datetime(df["event_time"], errors="coerce", utc=True)
+
+    # 3️⃣ 숫자형 컬럼 자동 변환
+    for col in ["click_count", "answer_len", "latency_ms"]:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+
+    # 4️⃣ 반복값이 많은 문자열 컬럼은 category(사전 인코딩)로 변환
+    # ✅ 성능 개선: value_counts/groupby/비교 연산이 정수 코드 기반으로 동작하고 메모리도 줄어듦
+    for col in _LOG_CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+
+    # 5️⃣ 컬럼 순서 재정렬 (보기 쉽게)
+    order_cols = [c for c in _LOG_ORDER_COLUMNS if c in df.columns]
+    return df[order_cols].sort_values("event_time").reset_index(drop=True)
+
+
 def load_logs_as_df(log_file: str) -> pd.DataFrame:
     """
     🧮 logs/events.csv → pandas DataFrame으로 로드합니다.
@@ -53,64 +143,131 @@ def load_logs_as_df(log_file: str) -> pd.DataFrame:
         # 파일이 없으면 빈 DataFrame 반환
         return pd.DataFrame(columns=CSV_HEADER)
 
-    # 1️⃣ CSV 읽기
-    df = pd.read_csv(
-        log_file,
-        dtype=str,
-        engine="python",
-        on_bad_lines="skip",
-        encoding="utf-8-sig",
-    )
+    with open(log_file, "rb") as f:
+        return _normalize_log_df(_read_log_csv(f.read()))
 
-    # 2️⃣ 표준 컬럼 보장 (없는 경우 빈 컬럼으로 채움)
-    for col in CSV_HEADER:
-        if col not in df.columns:
-            df[col] = ""
 
-    # 3️⃣ event_time 문자열 → datetime 변환 (UTC 기준)
-    df["event_time"] = pd.to_datetime(df["event_time"], errors="coerce", utc=True)
+def _append_log_rows(prefix: pd.DataFrame, tail: pd.DataFrame) -> pd.DataFrame:
+    """
+    정리된 로그 DataFrame 뒤에 새로 읽은 행을 이어 붙입니다.
+    - category 컬럼은 범주를 합쳐(union_categoricals) object로 풀리지 않게 유지
+    - 로그는 대부분 시간순으로 쌓이므로 순서가 어긋난 경우에만 다시 정렬
+    """
+    if tail.empty:
+        return prefix
+    if prefix.empty:
+        return tail
+
+    df = pd.concat([prefix, tail], ignore_index=True, copy=False)
+    for col in _LOG_CATEGORY_COLUMNS:
+        if col in prefix.columns and col in tail.columns:
+            df[col] = union_categoricals([prefix[col], tail[col]], ignore_order=True)
+
+    if tail["event_time"].min() < prefix["event_time"].max():
+        df = df.sort_values("event_time", kind="stable").reset_index(drop=True)
+    return df
 
-    # # 4️⃣ payload_json 컬럼을 안전하게 JSON → dict로 변환
-    # def _safe_json_loads(x):
-    #     try:
-    #         return json.loads(x) if isinstance(x, str) and x.strip() else {}
-    #     except Exception:
-    #         return {}
 
-    # payloads = df["payload_json"].apply(_safe_json_loads)
+# 증분 로딩 시 파일 동일성 확인에 쓰는 "마지막으로 읽은 위치 직전" 바이트 수
+_LOG_TAIL_FINGERPRINT_LEN = 64
 
-    # 5️⃣ payload 내용을 별도의 컬럼으로 확장 (json_normalize)
-    # payload_df = pd.json_normalize(payloads)
 
-    # 4️⃣ 숫자형 컬럼 자동 변환
-    for col in ["click_count", "answer_len", "latency_ms"]:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
+def load_logs_as_df_cached(log_file: str) -> pd.DataFrame:
+    """
+    🧮 load_logs_as_df의 증분(tail) 로딩 버전
+    - 로그 뷰어는 탭/필터를 바꿀 때마다 rerun되므로, 파일이 바뀌지 않았으면 CSV를 다시 파싱하지 않습니다.
+    - ✅ 성능 개선: 로그 파일은 뒤에 추가만 되므로, 마지막으로 읽은 바이트 위치를 세션에 기억해 두고
+      새로 추가된 부분만 파싱해 기존 DataFrame 뒤에 붙입니다. (작업량 ∝ 새 로그 수)
+    - 파일이 교체(inode 변경)/줄어들었거나, 마지막으로 읽은 위치 직전 바이트가 달라졌으면
+      (잘린 뒤 다시 커진 경우) 처음부터 다시 읽습니다.
+    - 아직 줄바꿈으로 끝나지 않은(쓰는 중인) 마지막 줄은 다음 읽기로 미룹니다.
+    - 호출부가 컬럼을 추가/수정해도 캐시가 바뀌지 않도록 항상 복사본을 반환합니다.
+    """
+    try:
+        stat = os.stat(log_file)
+    except OSError:
+        return pd.DataFrame(columns=CSV_HEADER)
+    size = stat.st_size
+
+    cached = st.session_state.get("_log_tail")
+    if (
+        cached
+        and cached["path"] == log_file
+        and cached.get("ino") == stat.st_ino
+        and cached["offset"] <= size
+    ):
+        if cached["mtime_ns"] == stat.st_mtime_ns and cached["offset"] == size:
+            return cached["df"].copy()
+        offset = cached["offset"]
+    else:
+        cached, offset = None, 0
+
+    with open(log_file, "rb") as f:
+        if cached:
+            # 마지막으로 읽은 위치 직전 바이트가 그대로인지 확인 (같은 파일에 append만 된 경우에만 이어 읽기)
+            check_len = len(cached["fingerprint"])
+            f.seek(offset - check_len)
+            if f.read(check_len) != cached["fingerprint"]:
+                cached, offset = None, 0
+        f.seek(offset)
+        data = f.read()
+    complete_len = data.rfind(b"\n") + 1
+    if complete_len == 0:
+        # 헤더 줄조차 아직 다 쓰이지 않았으면 다음 rerun에서 처음부터 다시 읽음
+        return cached["df"].copy() if cached else pd.DataFrame(columns=CSV_HEADER)
+    data = data[:complete_len]
+
+    if cached:
+        tail = _normalize_log_df(_read_log_csv(data, names=cached["columns"]))
+        df = _append_log_rows(cached["df"], tail)
+        columns = cached["columns"]
+    else:
+        raw = _read_log_csv(data)
+        columns = list(raw.columns)
+        df = _normalize_log_df(raw)
+
+    # 읽은 위치 직전 최대 _LOG_TAIL_FINGERPRINT_LEN 바이트 (다음 읽기 때 파일이 바뀌지 않았는지 확인용)
+    fingerprint = (cached["fingerprint"] + data) if cached else data
+    st.session_state["_log_tail"] = {
+        "path": log_file,
+        "ino": stat.st_ino,
+        "mtime_ns": stat.st_mtime_ns,
+        "offset": offset + complete_len,
+        "fingerprint": fingerprint[-_LOG_TAIL_FINGERPRINT_LEN:],
+        "columns": columns,
+        "df": df,
+    }
+    return df.copy()
+
+
+def read_log_tail_lines(log_file: str, n: int = 10, block_size: int = 64 * 1024) -> list[str]:
+    """
+    📄 CSV 파일의 헤더 + 마지막 n줄만 읽어서 반환합니다.
+    - 파일 끝에서부터 block_size 단위로 거꾸로 읽으므로 파일 크기와 무관하게 빠릅니다.
+    - 파일 전체를 DataFrame으로 파싱하지 않고 원본 줄을 그대로 돌려줍니다.
+    """
+    if not os.path.exists(log_file) or n <= 0:
+        return []
 
+    with open(log_file, "r", encoding="utf-8-sig") as f:
+        header = f.readline()
 
-    # 컬럼 순서 재정렬 (보기 쉽게)
-    order_cols = [
-        "event_id",
-        "event_time",
-        "event_name",
-        "user_id",
-        "session_id",
-        "surface",
-        "source",
-        "news_id",
-        "term",
-        "message",
-        "note",
-        "title",
-        "click_count",
-        "answer_len",
-        "via",
-        "latency_ms",
-        "payload",  # ✅ 그대로 유지
-    ]
-    order_cols = [c for c in order_cols if c in df.columns]
-    df = df[order_cols].sort_values("event_time").reset_index(drop=True)
-    return df
+    with open(log_file, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        pos = size
+        data = b""
+        # 마지막 n줄(+잘린 첫 줄 1개)이 확보될 때까지 블록 단위로 뒤에서 읽기
+        while pos > 0 and data.count(b"\n") <= n:
+            read_size = min(block_size, pos)
+            pos -= read_size
+            f.seek(pos)
+            data = f.read(read_size) + data
+
+    lines = data.decode("utf-8-sig", errors="ignore").splitlines(keepends=True)
+    if pos == 0 and lines:
+        lines = lines[1:]  # 파일 처음까지 읽었다면 첫 줄은 헤더
+    return [header] + lines[-n:]
 
 
 # ─────────────────────────────────────────────────────────────
@@ -137,6 +294,8 @@ def get_openai_client(api_key: str = None):
         return None
 
     # 3) 정상 생성
+    # ✅ 최적화: openai SDK는 무거우므로 클라이언트가 처음 필요할 때만 import (cache_resource로 1회)
+    from openai import OpenAI
     return OpenAI(api_key=key)
 
 
@@ -8,6 +8,10 @@ from urllib.parse import urlparse
 from core.logger import get_supabase_client
 from core.config import SUPABASE_ENABLE
 
+# 뉴스 목록/검색 화면에서 실제로 사용하는 news 테이블 컬럼만 조회 (점수/메타 컬럼 전송 생략)
+# (기사 URL 컬럼은 url 하나 - 이 목록에 없는 컬럼은 포매터에서 참조하지 않음)
+NEWS_LIST_COLUMNS = "news_id,title,summary,content,url,published_at,created_at"
+
 # Fallback용 샘플 데이터 (Supabase 연결 실패 시 사용)
 FALLBACK_NEWS = [
     {
@@ -80,7 +84,7 @@ def search_news_from_supabase(keyword: str, limit: int = 5) -> List[Dict]:
             try:
                 field_response = (
                     supabase.table("news")
-                    .select("*")
+                    .select(NEWS_LIST_COLUMNS)
                     .is_("deleted_at", "null")
                     .ilike(field, f"%{keyword}%")
                     .limit(limit * 10)  # 충분히 많이 가져오기
@@ -230,7 +234,7 @@ def search_news_from_supabase(keyword: str, limit: int = 5) -> List[Dict]:
                 ),
                 "content": news.get("content", "내용 없음"),
                 "date": date,
-                "url": news.get("url") or news.get("link") or ""
+                "url": news.get("url") or ""
             })
         
         return formatted_news
@@ -279,7 +283,7 @@ def _fetch_news_from_supabase(limit: int = 3) -> List[Dict]:
         # impact_score가 70점 이상인 뉴스만 필터링하고 최신순으로 정렬
         query = (
             supabase.table("news")
-            .select("*")
+            .select(NEWS_LIST_COLUMNS)
             .is_("deleted_at", "null")
             .gte("impact_score", 70)  # impact_score가 70 이상인 것만
             .order("published_at", desc=True)  # 최신순으로 먼저 정렬
@@ -375,7 +379,7 @@ def _fetch_news_from_supabase(limit: int = 3) -> List[Dict]:
                 "summary": summary,
                 "content": content,
                 "date": date,
-                "url": news.get("url") or news.get("link") or ""
+                "url": news.get("url") or ""
             })
 
         return formatted_news
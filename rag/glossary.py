@@ -14,13 +14,15 @@ import os
 import time
 import threading
 import pandas as pd
-from typing import Dict, List, Optional, Union
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
 from persona.persona import (
     albwoong_persona_reply,
     generate_structured_persona_reply,
 )
 from core.logger import get_supabase_client
 from core.config import SUPABASE_ENABLE
+from rag.term_index import get_term_index
 import chromadb
 from chromadb.config import Settings
 from sentence_transformers import SentenceTransformer
@@ -72,12 +74,14 @@ DEFAULT_TERMS = {
     },
 }
 
+# 동의어 필드 구분자 (쉼표/줄바꿈) - 모듈 로드 시 한 번만 컴파일
+_SYNONYM_SPLIT = re.compile(r"[,\n]")
 
-def _cache_rag_metadata(metadatas: List[Dict]):
+
+def _build_rag_term_maps(metadatas: List[Dict]):
     """
-    RAG 메타데이터를 세션에 캐싱하여 반복적인 collection.get() 호출을 줄입니다.
-    term / synonym 모두 소문자로 키를 만들어 lookup 속도를 높이고,
-    하이라이트용 용어 세트도 함께 저장합니다.
+    RAG 메타데이터로 (소문자 용어/동의어 → 메타데이터, 하이라이트용 용어 세트)를 만듭니다.
+    term / synonym 모두 소문자로 키를 만들어 lookup 속도를 높입니다.
     """
     metadata_map: Dict[str, Dict] = {}
     highlight_terms = set()
@@ -90,14 +94,91 @@ def _cache_rag_metadata(metadatas: List[Dict]):
 
         synonym_field = (meta.get("synonym") or "").strip()
         if synonym_field:
-            for raw in re.split(r"[,\n]", synonym_field):
+            for raw in _SYNONYM_SPLIT.split(synonym_field):
                 synonym = raw.strip()
                 if synonym:
                     metadata_map[synonym.lower()] = meta
                     highlight_terms.add(synonym)
 
+    return metadata_map, highlight_terms
+
+
+def _cache_rag_metadata(metadatas: List[Dict]):
+    """
+    RAG 메타데이터를 세션에 캐싱하여 반복적인 collection.get() 호출을 줄입니다.
+    하이라이트용 용어 세트도 함께 저장합니다.
+    - 용어 세트는 frozenset으로 저장: highlight_terms가 매 호출 변환 없이 바로 사용하고 해시도 재사용됨
+    """
+    metadata_map, highlight_terms = _build_rag_term_maps(metadatas)
+    st.session_state["rag_metadata_by_term"] = metadata_map
+    st.session_state["rag_terms_for_highlight"] = frozenset(highlight_terms)
+    st.session_state.pop("rag_exact_term_index", None)
+    # ✅ 성능 개선: 하이라이트 대상이 RAG 용어 세트로 바뀌는 시점(보통 백그라운드 초기화)에 인덱스도 미리 생성
+    # (앱 초기화 시의 prewarm은 텍스트 사전용이라, 여기서 안 만들면 첫 기사 진입이 RAG 인덱스를 만듦)
+    try:
+        prewarm_highlight_index()
+    except Exception:
+        pass
+
+
+@st.cache_resource(show_spinner=False)
+def _rag_terms(collection_id: str, term_count: int, _collection):
+    """
+    컬렉션 전체 메타데이터로 만든 용어 맵을 프로세스 단위로 캐싱 (st.cache_resource)
+    - ✅ 성능 개선: 세션마다/rerun마다 collection.get()으로 전체 컬렉션을 다시 읽지 않음
+    - collection_id + 문서 수로 키를 잡아 컬렉션이 재생성/재색인되면 자동으로 다시 로드
+    - 문서/임베딩은 필요 없으므로 metadatas만 가져옴
+    """
+    all_data = _collection.get(include=["metadatas"])
+    metadata_map, highlight_terms = _build_rag_term_maps((all_data or {}).get("metadatas") or [])
+    # 프로세스 전체(모든 세션)가 같은 객체를 공유하므로 용어 세트는 변경 불가(frozenset)로 반환
+    return metadata_map, frozenset(highlight_terms)
+
+
+def load_rag_term_metadata(collection=None) -> Dict[str, Dict]:
+    """
+    세션의 RAG 용어 맵을 반환 (없으면 캐시된 컬렉션 메타데이터로 채움)
+    - collection.get()을 직접 호출하던 곳들이 이 함수를 통해 캐시를 공유합니다.
+    - 컬렉션이 없으면 ValueError, Chroma 조회 오류는 RuntimeError로 정규화해 올립니다.
+    """
+    metadata_map = st.session_state.get("rag_metadata_by_term")
+    if metadata_map:
+        return metadata_map
+
+    if collection is None:
+        collection = st.session_state.get("rag_collection")
+    if collection is None:
+        raise ValueError("RAG 컬렉션이 없습니다")
+
+    collection_id = str(getattr(collection, "id", "") or getattr(collection, "name", ""))
+    try:
+        metadata_map, highlight_terms = _rag_terms(collection_id, collection.count(), collection)
+    except Exception as e:
+        raise RuntimeError(f"RAG 용어 메타데이터 로드 실패: {e}") from e
     st.session_state["rag_metadata_by_term"] = metadata_map
     st.session_state["rag_terms_for_highlight"] = highlight_terms
+    st.session_state.pop("rag_exact_term_index", None)
+    return metadata_map
+
+
+def load_rag_exact_term_index(collection=None):
+    """
+    챗봇 질문의 RAG 용어 정확 매칭용 TermIndex (대표 용어만, 동의어 제외)
+    - ✅ 성능 개선: 용어 튜플 정렬과 get_term_index 캐시 키 해시는 용어 맵이 바뀔 때 세션당 한 번만 수행
+      (질문마다 용어 맵 전체를 훑어 튜플을 다시 만들지 않음)
+    - 용어 맵이 비어 있으면 None, 로드 오류는 load_rag_term_metadata와 같은 예외로 올림
+    """
+    term_index = st.session_state.get("rag_exact_term_index")
+    if term_index is not None:
+        return term_index
+
+    metadata_map = load_rag_term_metadata(collection)
+    if not metadata_map:
+        return None
+    exact_terms = tuple(sorted({(m.get("term") or "").strip() for m in metadata_map.values()} - {""}))
+    term_index = get_term_index(exact_terms)
+    st.session_state["rag_exact_term_index"] = term_index
+    return term_index
 
 
 def _perf_enabled() -> bool:
@@ -374,6 +455,102 @@ def is_financial_context(text: str, term: str, match_start: int, match_end: int,
     # 문맥에 경제 관련 키워드가 없으면 경제 용어가 아님
     return False
 
+
+@lru_cache(maxsize=8)
+def _highlight_term_order(terms: frozenset) -> Tuple[tuple, str]:
+    """
+    하이라이트 용어 집합 → (긴 용어부터 정렬된 튜플, 용어 집합 digest)
+    - ✅ 성능 개선: 용어 집합마다 정렬/해시를 한 번만 계산 (RAG 용어 세트는 프로세스 공유 frozenset이라 조회가 O(1))
+    """
+    # 긴 용어부터 처리하여 부분 매칭 방지 (예: "부가가치세"가 "부가가치"보다 먼저 처리)
+    sorted_terms = tuple(sorted(terms, key=len, reverse=True))
+    digest = hashlib.md5("\n".join(sorted(terms)).encode("utf-8")).hexdigest()
+    return sorted_terms, digest
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _highlight_text_cached(text: str, terms_digest: str, _sorted_terms: tuple) -> tuple:
+    """
+    본문에 금융 용어 하이라이트 적용 (순수 함수, st.cache_data로 캐싱)
+    - 캐시 키는 (본문, 용어 집합 digest): 수천 개 용어 튜플을 호출마다 해싱하지 않음
+
+    Args:
+        text: 원본 텍스트
+        terms_digest: 용어 집합 식별자 (_highlight_term_order)
+        _sorted_terms: 긴 용어부터 정렬된 용어 튜플 (캐시 키에서 제외)
+
+    Returns:
+        (하이라이트된 HTML 문자열, 발견된 용어 frozenset)
+    """
+    highlighted = text
+    # ✅ 성능 개선: 빠른 사전 필터링 - 다중 패턴 인덱스로 텍스트를 한 번만 스캔해 포함된 용어만 처리
+    # (인덱스가 용어를 한 번만 소문자로 바꿔 두고 원래 표기를 돌려주므로, 전체 용어를 다시 lower()하며 훑지 않음)
+    found_terms = get_term_index(_sorted_terms).find_all(highlighted)
+    # 소문자 용어 → 원래 표기 (긴 용어 우선 순서)
+    term_by_lower: Dict[str, str] = {
+        term.lower(): term for term in sorted(found_terms, key=len, reverse=True)
+    }
+    
+    # ✅ 성능 개선: 발견된 용어 추적 (용어 필터링 재사용을 위해)
+    matched_terms_set = set()
+
+    if term_by_lower:
+        # ✅ 성능 개선: 용어별 finditer + 문자열 재조립 대신, 발견된 용어를 하나의 정규식으로 묶어 한 번에 치환
+        # 긴 용어를 앞에 두어 같은 위치에서는 긴 용어가 우선 (예: "부가가치세"가 "부가가치"보다 먼저)
+        pattern = re.compile("|".join(re.escape(t) for t in term_by_lower), re.IGNORECASE)
+
+        def _mark(match: "re.Match") -> str:
+            matched_text = match.group(0)
+            term = term_by_lower.get(matched_text.lower())
+            # ✅ 개선: 같은 용어는 첫 번째 매칭만 하이라이트 (가독성 향상)
+            if term is None or term in matched_terms_set:
+                return matched_text
+            matched_terms_set.add(term)
+            # HTML 태그 생성 (Streamlit은 클릭 이벤트를 지원하지 않으므로 시각적 표시만)
+            return (
+                f'<mark class="financial-term" '
+                f'style="background-color: #FFEB3B; padding: 2px 4px; border-radius: 3px;">'
+                f'{matched_text}</mark>'
+            )
+
+        highlighted = pattern.sub(_mark, highlighted)
+
+    return highlighted, frozenset(matched_terms_set)
+
+
+def _current_highlight_terms(load_rag: bool = True) -> Tuple[tuple, str]:
+    """
+    현재 세션의 하이라이트 용어 집합 → (긴 용어부터 정렬된 튜플, 용어 집합 digest)
+    - RAG 용어(+동의어) 우선, 없으면 기본 사전
+    - load_rag=False이면 세션에 이미 있는 용어만 사용 (Chroma 조회 없음)
+    """
+    terms_to_highlight = st.session_state.get("rag_terms_for_highlight")
+    if not terms_to_highlight and load_rag and st.session_state.get("rag_initialized", False):
+        try:
+            if load_rag_term_metadata():
+                terms_to_highlight = st.session_state.get("rag_terms_for_highlight")
+        except (ValueError, RuntimeError) as e:
+            st.warning(f"⚠️ RAG 용어 로드 중 오류, 기본 사전을 사용합니다: {e}")
+    if not terms_to_highlight:
+        terms_to_highlight = st.session_state.get("financial_terms", DEFAULT_TERMS).keys()
+
+    # ✅ 성능 개선: 세션별 md5/정렬 캐시 대신 용어 집합별로 한 번만 정렬·해시 (RAG 세트는 이미 frozenset)
+    if not isinstance(terms_to_highlight, frozenset):
+        terms_to_highlight = frozenset(terms_to_highlight)
+    return _highlight_term_order(terms_to_highlight)
+
+
+def prewarm_highlight_index() -> None:
+    """
+    하이라이트용 용어 정렬/다중 패턴 인덱스를 미리 만들어 둠
+    - 앱 초기화 시(텍스트 사전)와 RAG 메타데이터 캐싱 직후(RAG 용어 세트)에 호출
+    - ✅ 성능 개선: 첫 기사 상세 진입 시 오토마톤(또는 정규식) 생성 비용을 내지 않도록 초기화 단계로 이동
+    - 하이라이트 결과 캐시(st.cache_data)에는 아무것도 넣지 않음
+    """
+    sorted_terms, _ = _current_highlight_terms(load_rag=False)
+    get_term_index(sorted_terms)
+
+
 # ✨ 본문에서 금융 용어 하이라이트 (RAG 통합 버전 + 문맥 인식)
 # - 변경 사항:
 #   1. 기존: st.session_state.financial_terms 사전에서만 검색
@@ -388,143 +565,27 @@ def is_financial_context(text: str, term: str, match_start: int, match_end: int,
 def highlight_terms(text: str, article_id: Optional[str] = None, return_matched_terms: bool = False) -> Union[str, tuple[str, set[str]]]:
     """
     기사 본문에서 금융 용어를 찾아 하이라이트 처리 (캐싱 지원)
+    - return_matched_terms=True이면 캐시 히트 여부와 관계없이 항상 (HTML, 용어 세트) 튜플을 반환
+    - 결과는 (본문, 용어 집합)으로 st.cache_data에 캐싱되어 세션/rerun 간 재사용
+      (용어 집합이 바뀌면 자동으로 다른 키 → 오래된 하이라이트가 남지 않음)
 
     Args:
         text: 원본 텍스트(기사 본문 등)
-        article_id: 기사 ID (캐싱 키로 사용, None이면 캐싱 안 함)
+        article_id: 기사 ID (하위 호환용, 캐시 키는 본문 기준이라 사용하지 않음)
         return_matched_terms: True일 경우 (하이라이트된 텍스트, 발견된 용어 세트) 튜플 반환
 
     Returns:
         return_matched_terms=False: 금융 용어가 하이라이트 처리된 HTML 문자열
         return_matched_terms=True: (하이라이트된 HTML 문자열, 발견된 용어 세트) 튜플
     """
-    # ✅ 성능 개선: 기사별 하이라이트 결과 캐싱
-    if article_id:
-        cache_key = f"highlight_cache_{article_id}"
-        text_hash = hashlib.md5(text.encode('utf-8')).hexdigest()
-        cache_entry = st.session_state.get(cache_key)
-        
-        # 캐시가 있고 텍스트가 변경되지 않았으면 캐시된 결과 반환
-        if cache_entry and cache_entry.get("text_hash") == text_hash:
-            cached_highlighted = cache_entry.get("highlighted", text)
-            if return_matched_terms:
-                cached_matched_terms = cache_entry.get("matched_terms", set())
-                return cached_highlighted, cached_matched_terms
-            return cached_highlighted
-    
-    highlighted = text
-    terms_to_highlight = set()
+    sorted_terms, terms_digest = _current_highlight_terms()
 
-    cached_terms = st.session_state.get("rag_terms_for_highlight")
-    if cached_terms:
-        terms_to_highlight = set(cached_terms)
-    elif st.session_state.get("rag_initialized", False):
-        try:
-            collection = st.session_state.get("rag_collection")
-            if collection is None:
-                raise ValueError("RAG 컬렉션이 없습니다")
-            all_data = collection.get()
-            if all_data and all_data['metadatas']:
-                _cache_rag_metadata(all_data['metadatas'])
-                terms_to_highlight = set(st.session_state.get("rag_terms_for_highlight", []))
-        except Exception as e:
-            st.warning(f"⚠️ RAG 용어 로드 중 오류, 기본 사전을 사용합니다: {e}")
-            terms_to_highlight = set(st.session_state.get("financial_terms", DEFAULT_TERMS).keys())
-    else:
-        terms_to_highlight = set(st.session_state.get("financial_terms", DEFAULT_TERMS).keys())
-
-    # ✅ 성능 개선: 정렬된 용어 목록을 세션에 캐싱 (용어 목록이 변경되지 않는 한 재사용)
-    sorted_terms_cache_key = "highlight_sorted_terms_cache"
-    sorted_terms_hash_key = "highlight_sorted_terms_hash"
-    
-    current_terms_hash = hashlib.md5(str(sorted(terms_to_highlight)).encode('utf-8')).hexdigest()
-    cached_sorted_terms = st.session_state.get(sorted_terms_cache_key)
-    cached_terms_hash = st.session_state.get(sorted_terms_hash_key)
-    
-    if cached_sorted_terms and cached_terms_hash == current_terms_hash:
-        sorted_terms = cached_sorted_terms
-    else:
-        # 긴 용어부터 처리하여 부분 매칭 방지 (예: "부가가치세"가 "부가가치"보다 먼저 처리)
-        sorted_terms = sorted(terms_to_highlight, key=len, reverse=True)
-        st.session_state[sorted_terms_cache_key] = sorted_terms
-        st.session_state[sorted_terms_hash_key] = current_terms_hash
-
-    # ✅ 성능 개선: 정규식 패턴 컴파일 캐싱
-    pattern_cache_key = "highlight_pattern_cache"
-    if pattern_cache_key not in st.session_state:
-        st.session_state[pattern_cache_key] = {}
-    pattern_cache = st.session_state[pattern_cache_key]
-
-    # 이미 하이라이트된 부분을 보호하기 위한 임시 플레이스홀더 맵
-    placeholders = {}
-    placeholder_counter = 0
-
-    # ✅ 성능 개선: 빠른 사전 필터링 - 텍스트에 포함된 용어만 처리
-    text_lower = highlighted.lower()
-    terms_in_text = [term for term in sorted_terms if term and term.lower() in text_lower]
-    
-    # ✅ 성능 개선: 발견된 용어 추적 (용어 필터링 재사용을 위해)
-    matched_terms_set = set()
-
-    for term in terms_in_text:
-        # 플레이스홀더가 아닌 실제 텍스트만 매칭하도록 패턴 생성
-        # __PLACEHOLDER_로 시작하는 부분은 제외
-        escaped_term = re.escape(term)
-
-        # ✅ 성능 개선: 정규식 패턴 캐싱
-        if escaped_term not in pattern_cache:
-            pattern_cache[escaped_term] = re.compile(escaped_term, re.IGNORECASE)
-        pattern = pattern_cache[escaped_term]
-
-        # 매칭된 원래 표기를 유지하면서 하이라이트
-        # ✅ 개선: 같은 용어는 첫 번째 매칭만 하이라이트 (가독성 향상)
-        matches = []
-        for match in pattern.finditer(highlighted):
-            # 매칭된 위치가 플레이스홀더 안에 있는지 확인
-            start_pos = match.start()
-            # 매칭 위치 이전에 플레이스홀더가 있고 아직 닫히지 않았는지 체크
-            # ✅ 성능 개선: 더 효율적인 플레이스홀더 체크
-            if start_pos > 0 and '__PLACEHOLDER_' in highlighted[max(0, start_pos-30):start_pos]:
-                continue
-            matches.append(match)
-            # ✅ 개선: 첫 번째 매칭만 처리하고 중단
-            break
-
-        # 첫 번째 매칭만 하이라이트 처리
-        if matches:
-            match = matches[0]
-            matched_text = match.group(0)
-            # ✅ 성능 개선: 매칭된 용어 추적
-            matched_terms_set.add(term)
-            
-            # HTML 태그 생성 (Streamlit은 클릭 이벤트를 지원하지 않으므로 시각적 표시만)
-            placeholder = f"__PLACEHOLDER_{placeholder_counter}__"
-            mark_html = (
-                f'<mark class="financial-term" '
-                f'style="background-color: #FFEB3B; padding: 2px 4px; border-radius: 3px;">'
-                f'{matched_text}</mark>'
-            )
-            placeholders[placeholder] = mark_html
-            placeholder_counter += 1
-
-            # 텍스트 치환
-            highlighted = highlighted[:match.start()] + placeholder + highlighted[match.end():]
-
-    # 모든 플레이스홀더를 실제 HTML로 복원
-    for placeholder, mark_html in placeholders.items():
-        highlighted = highlighted.replace(placeholder, mark_html)
-
-    # ✅ 성능 개선: 결과를 캐시에 저장
-    if article_id:
-        st.session_state[cache_key] = {
-            "text_hash": text_hash,
-            "highlighted": highlighted,
-            "matched_terms": matched_terms_set  # 발견된 용어도 함께 캐싱
-        }
+    # ✅ 성능 개선: 같은 본문·용어 집합이면 세션/사용자 간에 하이라이트 결과 재사용 (st.cache_data)
+    highlighted, matched_terms = _highlight_text_cached(text, terms_digest, sorted_terms)
 
     # ✅ 성능 개선: 발견된 용어 반환 (용어 필터링 재사용)
     if return_matched_terms:
-        return highlighted, matched_terms_set
+        return highlighted, set(matched_terms)
     
     return highlighted
 
@@ -578,22 +639,60 @@ def _build_structured_context_from_default(term: str, info: Dict[str, str]) -> D
     return context
 
 
-def _generate_structured_term_response(
+class _TermResponseUnavailable(Exception):
+    """LLM 용어 설명 생성 실패 (st.cache_data는 예외를 캐싱하지 않으므로 실패 결과는 저장되지 않음)"""
+
+
+@st.cache_data(max_entries=512, show_spinner=False)
+def _explain_term_cached(
     base_term: str,
-    context: Dict[str, str],
-    question_term: Optional[str] = None,
-    temperature: float = 0.25,
+    question_text: str,
+    context_items: tuple,
+    temperature: float,
 ) -> str:
-    question_text = question_term or base_term
-    user_prompt = f"{question_text}가 뭐야?"
+    """
+    용어 설명 LLM 응답 캐시 (대화 이력과 무관한 부분만)
+    - 같은 용어/컨텍스트면 rerun·사용자 간에 LLM 호출을 재사용 (최근 512개 유지)
+    - 실패 시 _TermResponseUnavailable을 던져 오류 응답이 캐시에 남지 않도록 함
+    """
     response = generate_structured_persona_reply(
-        user_input=user_prompt,
+        user_input=f"{question_text}가 뭐야?",
         term=base_term,
-        context=context,
+        context=dict(context_items),
         temperature=temperature,
     )
     if response and "(LLM 연결 오류" not in response:
         return response
+    raise _TermResponseUnavailable(base_term)
+
+
+def _generate_structured_term_response(
+    base_term: str,
+    context: Dict[str, str],
+    question_term: Optional[str] = None,
+    temperature: float = 0.25,
+    session_cache: Optional[Dict] = None,
+    cache_key=None,
+) -> str:
+    """
+    구조화된 용어 설명 생성 (실패 시 사전 정보로 만든 간단한 설명)
+    - session_cache가 주어지면 LLM 응답이 성공한 경우에만 cache_key로 저장
+      (일시적인 LLM 오류의 대체 응답이 세션 내내 남지 않도록 함)
+    """
+    question_text = question_term or base_term
+    # ✅ 성능 개선: 동일 용어 반복 클릭 시 LLM 재호출 없이 캐시된 응답 사용
+    try:
+        response = _explain_term_cached(
+            base_term,
+            question_text,
+            tuple(sorted(context.items())),
+            temperature,
+        )
+        if session_cache is not None:
+            session_cache[cache_key] = response
+        return response
+    except _TermResponseUnavailable:
+        pass
 
     # LLM 호출 실패 시 간단한 정보라도 제공
     parts: List[str] = [f"🤖 **{base_term}** 에 대해 설명해줄게! 🎯"]
@@ -1283,15 +1382,7 @@ def explain_term(term: str, chat_history=None, return_rag_info: bool = False):
 
     if st.session_state.get("rag_initialized", False):
         try:
-            metadata_map = st.session_state.get("rag_metadata_by_term")
-            if not metadata_map:
-                collection = st.session_state.get("rag_collection")
-                if collection is None:
-                    raise ValueError("RAG 컬렉션이 없습니다")
-                all_data = collection.get()
-                if all_data and all_data["metadatas"]:
-                    _cache_rag_metadata(all_data["metadatas"])
-                    metadata_map = st.session_state.get("rag_metadata_by_term", {})
+            metadata_map = load_rag_term_metadata()
 
             if metadata_map:
                 metadata = metadata_map.get(term.lower())
@@ -1299,7 +1390,7 @@ def explain_term(term: str, chat_history=None, return_rag_info: bool = False):
                     base_term = (metadata.get("term") or "").strip()
                     synonym_field = (metadata.get("synonym") or "").strip()
                     if synonym_field:
-                        synonyms = [s.strip().lower() for s in re.split(r"[,\n]", synonym_field) if s.strip()]
+                        synonyms = [s.strip().lower() for s in _SYNONYM_SPLIT.split(synonym_field) if s.strip()]
                         synonym_matched = term.lower() in synonyms and term.lower() != base_term.lower()
                     else:
                         synonym_matched = False
@@ -1310,8 +1401,9 @@ def explain_term(term: str, chat_history=None, return_rag_info: bool = False):
                     correction = metadata.get("correction", "")
                     example = metadata.get("example", "")
 
+                    # 동의어로 물어본 경우 답변 문구가 달라지므로 (기준 용어, 질문 용어) 단위로 캐싱
                     cache = st.session_state.setdefault("rag_explanation_cache", {})
-                    cache_key = base_term.lower()
+                    cache_key = (base_term.lower(), term.lower())
                     response = cache.get(cache_key)
 
                     if response is None:
@@ -1325,8 +1417,9 @@ def explain_term(term: str, chat_history=None, return_rag_info: bool = False):
                             base_term=base_term,
                             context=structured_context,
                             question_term=term,
+                            session_cache=cache,
+                            cache_key=cache_key,
                         )
-                        cache[cache_key] = response
 
                     if return_rag_info:
                         rag_info = {
@@ -1350,13 +1443,19 @@ def explain_term(term: str, chat_history=None, return_rag_info: bool = False):
             return message, None
         return message
 
-    info = terms[term]
-    structured_context = _build_structured_context_from_default(term, info)
-    response = _generate_structured_term_response(
-        base_term=term,
-        context=structured_context,
-        question_term=term,
-    )
+    # ✅ 성능 개선: 기본 사전 경로도 세션 캐시 사용 (RAG 경로와 키 공간 분리)
+    cache = st.session_state.setdefault("default_explanation_cache", {})
+    response = cache.get(term)
+    if response is None:
+        info = terms[term]
+        structured_context = _build_structured_context_from_default(term, info)
+        response = _generate_structured_term_response(
+            base_term=term,
+            context=structured_context,
+            question_term=term,
+            session_cache=cache,
+            cache_key=term,
+        )
 
     if return_rag_info:
         return response, None
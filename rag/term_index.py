@@ -0,0 +1,131 @@
+"""
+═══════════════════════════════════════════════════════════════════════
+🔎 금융 용어 다중 패턴 매칭 인덱스
+═══════════════════════════════════════════════════════════════════════
+- 용어 사전 전체를 한 번의 스캔으로 문장/기사에서 찾아냅니다.
+  (용어마다 `term in text` / `re.search`를 반복하는 O(용어 수 × 텍스트 길이) 루프 대체)
+- pyahocorasick이 설치되어 있으면 Aho-Corasick 오토마톤을 사용하고,
+  없으면 컴파일된 정규식 alternation으로 동작합니다.
+"""
+
+import re
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+import streamlit as st
+
+# pyahocorasick (선택 의존성)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# 용어 뒤에 올 수 있는 문자 (공백, 문장부호, 조사)
+_WORD_END_CHARS = frozenset("?!.,은는이가을를과와로도의")
+
+
+class TermIndex:
+    """
+    금융 용어 집합에 대한 대소문자 무시 다중 패턴 매칭 인덱스
+
+    - find_all(text): text에 부분 문자열로 등장하는 모든 용어 (원래 표기) 반환
+    - find_first_word(text): 단어 경계에 맞는 용어 중 가장 앞(같은 위치면 가장 긴) 용어 반환
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        # 소문자 용어 → 원래 표기 (같은 소문자 용어가 여러 개면 처음 것 유지)
+        self._original_by_lower: Dict[str, str] = {}
+        for term in terms:
+            term = (term or "").strip()
+            if term:
+                self._original_by_lower.setdefault(term.lower(), term)
+
+        self._automaton = None
+        self._word_pattern = None
+        self._any_pattern = None
+        self._prefix_terms: Dict[str, Tuple[str, ...]] = {}
+        if not self._original_by_lower:
+            return
+
+        if AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for term_lower in self._original_by_lower:
+                automaton.add_word(term_lower, term_lower)
+            automaton.make_automaton()
+            self._automaton = automaton
+        else:
+            # 긴 용어를 먼저 두어 같은 위치에서는 가장 긴 용어가 매칭되도록 함
+            alternation = "|".join(
+                re.escape(t) for t in sorted(self._original_by_lower, key=len, reverse=True)
+            )
+            self._word_pattern = re.compile(
+                rf"(?:^|(?<=\s))({alternation})(?=$|\s|[?!.,은는이가을를과와로도의])",
+                re.IGNORECASE,
+            )
+            # find_all용: 각 위치에서 시작하는 가장 긴 용어를 lookahead로 찾고(겹치는 매칭 포함),
+            # 그 용어의 접두사인 다른 용어들도 같은 위치에서 등장한 것이므로 함께 반환
+            self._any_pattern = re.compile(rf"(?=({alternation}))")
+            self._prefix_terms = {
+                term_lower: tuple(
+                    self._original_by_lower[term_lower[:k]]
+                    for k in range(1, len(term_lower) + 1)
+                    if term_lower[:k] in self._original_by_lower
+                )
+                for term_lower in self._original_by_lower
+            }
+
+    def __len__(self) -> int:
+        return len(self._original_by_lower)
+
+    def _iter_matches(self, text_lower: str):
+        """Aho-Corasick 매칭 결과를 (시작, 끝(exclusive), 소문자 용어)로 반환"""
+        for end_idx, term_lower in self._automaton.iter(text_lower):
+            yield end_idx - len(term_lower) + 1, end_idx + 1, term_lower
+
+    def find_all(self, text: str) -> Set[str]:
+        """text에 포함된 모든 용어(원래 표기)를 반환 (`term.lower() in text.lower()`와 동일한 의미)"""
+        if not text or not self._original_by_lower:
+            return set()
+        text_lower = text.lower()
+        if self._automaton is not None:
+            return {self._original_by_lower[t] for _, _, t in self._iter_matches(text_lower)}
+        # ✅ 성능 개선: 용어마다 `in` 검사를 반복하지 않고 정규식 한 번의 스캔(C 레벨)으로 찾음
+        found: Set[str] = set()
+        for longest in {m.group(1) for m in self._any_pattern.finditer(text_lower)}:
+            found.update(self._prefix_terms[longest])
+        return found
+
+    def find_first_word(self, text: str) -> Optional[str]:
+        """
+        단어 경계에 맞춰 등장하는 첫 용어를 반환
+        - 앞: 문장 시작 또는 공백
+        - 뒤: 문장 끝, 공백, 문장부호(?!.,) 또는 조사(은/는/이/가/을/를/과/와/로/도/의)
+        """
+        if not text or not self._original_by_lower:
+            return None
+
+        if self._automaton is None:
+            match = self._word_pattern.search(text)
+            return self._original_by_lower.get(match.group(1).lower()) if match else None
+
+        text_lower = text.lower()
+        best: Optional[Tuple[int, int, str]] = None
+        for start, end, term_lower in self._iter_matches(text_lower):
+            if start > 0 and not text_lower[start - 1].isspace():
+                continue
+            if end < len(text_lower):
+                next_char = text_lower[end]
+                if not (next_char.isspace() or next_char in _WORD_END_CHARS):
+                    continue
+            if best is None or start < best[0] or (start == best[0] and end > best[1]):
+                best = (start, end, term_lower)
+        return self._original_by_lower[best[2]] if best else None
+
+
+@st.cache_resource(show_spinner=False)
+def get_term_index(terms: Tuple[str, ...]) -> TermIndex:
+    """
+    용어 튜플에 대한 TermIndex 생성 (st.cache_resource로 캐싱)
+    - 같은 용어 집합이면 세션/rerun 간 오토마톤(또는 정규식)을 재사용
+    """
+    return TermIndex(terms)
@@ -13,6 +13,7 @@ UUID 확인 스크립트
 import sys
 import os
 import json
+from collections import Counter
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.logger import get_supabase_client
@@ -29,16 +30,16 @@ def get_my_user_id() -> str:
         pass
     return ""
 
-def get_all_user_ids_from_supabase() -> list:
-    """Supabase event_logs에서 모든 사용자 UUID 조회"""
+def get_user_event_counts_from_supabase() -> Counter:
+    """Supabase event_logs에서 사용자별 이벤트 수 집계 (pandas 없이 Counter로 한 번에)"""
     if not SUPABASE_ENABLE:
         print("⚠️ Supabase가 비활성화되어 있습니다.")
-        return []
+        return Counter()
     
     supabase = get_supabase_client()
     if not supabase:
         print("⚠️ Supabase 클라이언트를 생성할 수 없습니다.")
-        return []
+        return Counter()
     
     try:
         # event_logs 테이블에서 고유한 user_id 조회
@@ -50,20 +51,18 @@ def get_all_user_ids_from_supabase() -> list:
         )
         
         if not response.data:
-            return []
-        
-        # 고유한 user_id만 추출
-        unique_user_ids = set()
-        for row in response.data:
-            user_id = row.get("user_id")
-            if user_id:
-                unique_user_ids.add(user_id)
+            return Counter()
         
-        return sorted(list(unique_user_ids))
+        # user_id별 이벤트 수 (고유 user_id = Counter의 키)
+        return Counter(row["user_id"] for row in response.data if row.get("user_id"))
     
     except Exception as e:
         print(f"❌ Supabase에서 사용자 조회 실패: {e}")
-        return []
+        return Counter()
+
+def get_all_user_ids_from_supabase() -> list:
+    """Supabase event_logs에서 모든 사용자 UUID 조회"""
+    return sorted(get_user_event_counts_from_supabase())
 
 def main():
     print("=" * 60)
@@ -80,14 +79,15 @@ def main():
     
     # 2. Supabase에서 모든 사용자 UUID 조회
     print(f"\n🔍 Supabase에서 모든 사용자 UUID 조회 중...")
-    all_user_ids = get_all_user_ids_from_supabase()
+    user_event_counts = get_user_event_counts_from_supabase()
+    all_user_ids = sorted(user_event_counts)
     
     if all_user_ids:
         print(f"\n👥 전체 사용자 UUID 목록 ({len(all_user_ids)}명):")
         print("-" * 60)
         for idx, user_id in enumerate(all_user_ids, 1):
             marker = " ← 내 UUID" if user_id == my_user_id else ""
-            print(f"{idx:2d}. {user_id}{marker}")
+            print(f"{idx:2d}. {user_id} (이벤트 {user_event_counts[user_id]:,}건){marker}")
         
         print("\n" + "=" * 60)
         print("📝 관리자 설정용 UUID 목록:")
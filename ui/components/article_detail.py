@@ -1,372 +1,304 @@
+import html
+import re
 import time
-from datetime import datetime
+from functools import lru_cache
 import streamlit as st
-from core.logger import log_event, start_view_timer, end_view_timer, is_page_hidden_eval
+from core.logger import GLOSSARY_INTERACTION_EVENT, is_logging_enabled, log_event, start_view_timer, end_view_timer, is_page_hidden_eval
 from rag.glossary import highlight_terms, explain_term
 
+
+def _elapsed_ms(start_ns: int) -> int:
+    """perf_counter_ns() 시작 시각부터 지금까지 경과 시간(ms, 정수 연산)"""
+    return (time.perf_counter_ns() - start_ns) // 1_000_000
+
+
+def _highlight_article(content: str, article_id) -> tuple:
+    """
+    기사 본문 하이라이트 + 용어 버튼 목록 (첫 렌더/재렌더 공용)
+    - ✅ 성능 개선: highlight_terms 결과가 (본문, 용어 집합) 키로 st.cache_data에 캐싱되므로
+      세션별 기사 캐시 없이도 재렌더/재방문/다른 세션 모두 캐시 조회로 끝남
+    - (하이라이트 HTML, 정렬된 용어 튜플) 반환 — 버튼 순서가 rerun 간 고정
+    """
+    highlighted_content, matched_terms = highlight_terms(
+        content, article_id=str(article_id) if article_id else None, return_matched_terms=True
+    )
+    return highlighted_content, tuple(sorted(matched_terms))
+
+
+# 문장 하나(공백이 아닌 문자로 시작 ~ 뒤에 공백이 오는 마침표/물음표/느낌표, 또는 본문 끝) 패턴
+# (모듈 로드 시 한 번만 컴파일, 앞뒤 공백은 매칭에 포함되지 않아 strip 불필요)
+_SENTENCE_RE = re.compile(r'(?=\S)(?:.*?[.!?。！？](?=\s)|.*\S)', re.DOTALL)
+
+
+@lru_cache(maxsize=512)
+def _format_paragraphs(content: str) -> str:
+    """
+    문단 구분이 없는 기사 본문을 3~4문장 단위 문단으로 재구성 (lru_cache로 캐싱)
+    - 이미 문단 구분(빈 줄)이 있으면 그대로 반환
+    - ✅ 성능 개선: 반환값이 불변 문자열이라 st.cache_data의 인자 해싱/결과 pickle 복사 없이 같은 객체를 재사용
+    """
+    if not content:
+        return content
+    # 이미 문단 구분이 있는지 확인 (줄바꿈 2개 이상)
+    if '\n\n' not in content and content.count('\n') < len(content) / 200:
+        # 문장 단위로 나누기 (마침표, 물음표, 느낌표 기준)
+        # 한글 마침표(.), 영문 마침표(.), 물음표(?), 느낌표(!) 후 공백이 오면 문장 끝으로 간주
+        # ✅ 성능 개선: split 후 구분자 재결합/strip 대신 findall 한 번으로 문장을 바로 추출
+        formatted_paragraphs = []
+        current_paragraph = []
+        paragraph_len = -1  # ' '.join(current_paragraph) 길이 (문장마다 길이+공백 1, 시작값 -1로 첫 공백 상쇄)
+
+        for sentence in _SENTENCE_RE.findall(content):
+            current_paragraph.append(sentence)
+            paragraph_len += len(sentence) + 1
+
+            # 3-4문장마다 또는 문장이 길면(150자 이상) 문단 구분
+            if len(current_paragraph) >= 3 or paragraph_len > 150:
+                formatted_paragraphs.append(' '.join(current_paragraph))
+                current_paragraph = []
+                paragraph_len = -1
+
+        # 남은 문장들 처리
+        if current_paragraph:
+            formatted_paragraphs.append(' '.join(current_paragraph))
+
+        # 문단 구분자로 합치기
+        if formatted_paragraphs:
+            content = '\n\n'.join(formatted_paragraphs)
+    return content
+
+
+def _render_article_body(article: dict, highlighted_content: str) -> None:
+    """
+    기사 제목/날짜/하이라이트된 본문/원문 링크 출력 (첫 진입과 재렌더 공용)
+    - ✅ 성능 개선: 요소마다 st.markdown/st.header/st.caption을 따로 보내지 않고 마크다운 한 블록으로 전송
+    - 본문을 article-content div 안에 실제로 감싸 스타일이 적용되도록 함
+      (div 앞뒤 빈 줄: 안쪽 본문은 계속 마크다운 문단으로 처리됨)
+    - unsafe_allow_html 블록이므로 DB에서 온 제목/날짜/URL은 html.escape로 이스케이프
+      (HTML 허용은 하이라이트 <mark> 태그가 들어간 본문에만 필요)
+    """
+    parts = [
+        "---",
+        f"## {html.escape(str(article['title']))}",
+        f"<small>📅 {html.escape(str(article['date']))}</small>",
+        f'<div class="article-content">\n\n{highlighted_content}\n\n</div>',
+    ]
+    url = article.get("url")
+    if url:
+        parts.append(f"[🔗 기사 원문 보기]({html.escape(str(url))})")
+    st.markdown("\n\n".join(parts), unsafe_allow_html=True)
+
+
+def _on_term_click(term: str, article: dict) -> None:
+    """용어 버튼 클릭 콜백: 설명 생성 + 대화 기록 + 클릭/답변 로그"""
+    # ✅ 성능 측정: 용어 클릭 전체 처리 시간
+    term_click_start = time.perf_counter_ns()
+    st.session_state.term_click_count += 1
+
+    user_question = f"'{term}' 용어를 설명해주세요"
+    # 대화 히스토리 (사용자 발화 1회만 기록)
+    st.session_state.chat_history.append({"role": "user", "content": user_question})
+
+    # ✅ 성능 측정: 설명 생성 시간
+    explanation_start = time.perf_counter_ns()
+    explanation, rag_info = explain_term(term, st.session_state.chat_history, return_rag_info=True)
+    explanation_latency_ms = _elapsed_ms(explanation_start)
+
+    # ✅ 성능 측정: 전체 처리 시간
+    total_latency_ms = _elapsed_ms(term_click_start)
+
+    # 답변 히스토리
+    st.session_state.chat_history.append({"role": "assistant", "content": explanation})
+
+    # ✅ 성능 개선: 클릭(자동 질문)과 답변을 한 이벤트로 기록 (CSV 1행, 직렬화/큐 전달 1회)
+    # 서버로는 logger에서 glossary_click / glossary_answer로 나눠 전송 (두 이벤트가 같은 payload 객체를 공유)
+    news_id = article.get("id")
+    answer_len = len(explanation)
+    log_event(
+        GLOSSARY_INTERACTION_EVENT,
+        term=term,
+        news_id=news_id,
+        source="news_highlight",
+        surface="detail",
+        message=user_question,
+        click_count=st.session_state.term_click_count,
+        answer_len=answer_len,
+        latency_ms=total_latency_ms,  # 전체 처리 시간
+        via="rag",
+        response=explanation,
+        payload={
+            "term": term,
+            "news_id": news_id,
+            "perf_steps": {
+                "explanation_ms": explanation_latency_ms,  # 설명 생성 시간
+                "total_ms": total_latency_ms,  # 전체 처리 시간
+                "answer_length": answer_len,  # 답변 길이
+            },
+            "rag_info": rag_info,  # RAG 정보 (payload에만 한 번 담고, 답변 이벤트의 rag_info는 logger가 여기서 꺼내 씀)
+        }
+    )
+
+
+def _term_button(term: str, article: dict) -> None:
+    """용어 버튼 1개 렌더링"""
+    # ✅ 성능 개선: 클릭 처리를 on_click 콜백으로 옮겨, 클릭 후 st.rerun()으로 상세 페이지
+    #              (본문/용어 그리드)를 한 번 더 그리지 않고 클릭 rerun 한 번에 새 대화를 반영
+    st.button(
+        f"📌 {term}",
+        key=f"term_btn_{term}",
+        use_container_width=True,
+        on_click=_on_term_click,
+        args=(term, article),
+    )
+
+
+def _on_back_click(article: dict) -> None:
+    """뒤로가기 버튼 콜백: 열람 정보를 담은 통합 로그 기록 후 목록으로 이동"""
+    # ✅ 성능 측정: 뒤로가기 처리 시간
+    back_start = time.perf_counter_ns()
+    
+    # ✅ 로그 중복 제거: end_view_timer() 내부 로그와 통합
+    duration_sec = None
+    max_depth_pct = None
+    if st.session_state.get("detail_enter_logged"):
+        # end_view_timer() 내부에서 계산하는 정보를 직접 가져옴
+        if "view_start_ns" in st.session_state:
+            duration_sec = (time.perf_counter_ns() - st.session_state["view_start_ns"]) / 1e9
+        max_depth_pct = st.session_state.get("detail_max_depth_pct", 0.0)
+        
+        # 통합 로그로 기록하므로 end_view_timer()는 호출하지 않고 세션 상태만 정리
+        for k in ("view_start_ns", "view_news_id", "detail_max_depth_pct"):
+            if k in st.session_state:
+                del st.session_state[k]
+    
+    # ✅ 통합 로그 1번만 기록 (view_duration + news_detail_back 정보 포함, 전송은 백그라운드 워커)
+    log_event(
+        "news_detail_back", 
+        news_id=article.get("id"), 
+        surface="detail",
+        payload={
+            "back_process_ms": _elapsed_ms(back_start),
+            "duration_sec": round(duration_sec, 2) if duration_sec is not None else None,
+            "max_depth_pct": round(max_depth_pct, 1) if max_depth_pct is not None else None,
+        }
+    )
+    
+    st.session_state.selected_article = None
+    st.session_state.detail_enter_logged = False
+
+
+# 처음에 보여줄 용어 버튼 수 (나머지는 "더 보기"로 펼침)
+TERM_BUTTON_LIMIT = 12
+
+
+def _show_all_terms(article_key) -> None:
+    """"더 보기" 콜백: 현재 기사의 용어 버튼을 모두 표시"""
+    st.session_state["terms_show_all_for"] = article_key
+
+
 def render():
     article = st.session_state.selected_article
     if not article:
         st.warning("선택된 기사가 없습니다.")
         return
 
-    # ✅ 최초 진입 시에만 기사 렌더 latency 측정
-    if not st.session_state.get("detail_enter_logged"):
-        t0 = time.time()
-        perf_steps = {}  # 성능 측정 단계별 시간
+    article_id = article.get("id")
+    first_entry = not st.session_state.get("detail_enter_logged")
 
+    # ✅ 최초 진입 시에만 기사 렌더 latency 측정
+    if first_entry:
+        t0 = time.perf_counter_ns()
         # 상세 진입 타이머 시작
-        start_view_timer(article.get("id"))
+        start_view_timer(article_id)
 
-        # 실제 렌더링
-        st.markdown("---")
-        st.header(article['title'])
-        st.caption(f"📅 {article['date']}")
-        st.markdown('<div class="article-content">', unsafe_allow_html=True)
-        
-        # ✅ 성능 측정: 하이라이트 처리 시간
-        article_id = article.get("id")
-        content = article['content']
-        
-        # 컨텐츠에 문단 구분이 없으면 자동으로 문단 생성
-        if content:
-            import re
-            # 이미 문단 구분이 있는지 확인 (줄바꿈 2개 이상)
-            if '\n\n' not in content and content.count('\n') < len(content) / 200:
-                # 문장 단위로 나누기 (마침표, 물음표, 느낌표 기준)
-                # 한글 마침표(.), 영문 마침표(.), 물음표(?), 느낌표(!) 후 공백이 오면 문장 끝으로 간주
-                sentences = re.split(r'([.!?。！？]\s+)', content)
-                
-                # 문장들을 재조합하면서 문단 생성 (3-4문장마다 문단 구분)
-                formatted_paragraphs = []
-                current_paragraph = []
-                sentence_count = 0
-                
-                for i in range(0, len(sentences), 2):
-                    if i + 1 < len(sentences):
-                        sentence = sentences[i] + sentences[i + 1]
-                    else:
-                        sentence = sentences[i]
-                    
-                    if sentence.strip():
-                        current_paragraph.append(sentence.strip())
-                        sentence_count += 1
-                        
-                        # 3-4문장마다 또는 문장이 길면(150자 이상) 문단 구분
-                        if sentence_count >= 3 or len(' '.join(current_paragraph)) > 150:
-                            if current_paragraph:
-                                formatted_paragraphs.append(' '.join(current_paragraph))
-                                current_paragraph = []
-                                sentence_count = 0
-                
-                # 남은 문장들 처리
-                if current_paragraph:
-                    formatted_paragraphs.append(' '.join(current_paragraph))
-                
-                # 문단 구분자로 합치기
-                if formatted_paragraphs:
-                    content = '\n\n'.join(formatted_paragraphs)
-        
-        highlight_start = time.time()
-        # ✅ 성능 개선: 하이라이트 처리에서 발견된 용어도 함께 받아서 재사용
-        result = highlight_terms(content, article_id=str(article_id) if article_id else None, return_matched_terms=True)
-        if isinstance(result, tuple):
-            highlighted_content, matched_terms_from_highlight = result
-        else:
-            highlighted_content = result
-            matched_terms_from_highlight = set()
-        highlight_elapsed_ms = int((time.time() - highlight_start) * 1000)
-        perf_steps["highlight_ms"] = highlight_elapsed_ms
-        # ✅ 하이라이트 캐시 히트 추정: 처리 시간이 5ms 이하면 캐시 히트로 간주
-        highlight_cache_hit = highlight_elapsed_ms <= 5
-        
-        # ✅ 하이라이트 결과를 캐시에 저장 (재렌더링 시 즉시 사용)
-        if article_id:
-            highlight_cache_key = f"article_highlight_cache_{article_id}"
-            st.session_state[highlight_cache_key] = highlighted_content
-        
-        st.markdown(highlighted_content, unsafe_allow_html=True)
-        st.markdown('</div>', unsafe_allow_html=True)
-        if article.get("url"):
-            st.markdown(f"[🔗 기사 원문 보기]({article['url']})")
-
-        # ✅ 성능 측정: 용어 목록 필터링 시간
-        terms_filter_start = time.time()
-        # ✅ 성능 개선: 하이라이트 처리에서 이미 발견된 용어 재사용 (O(1) 복잡도)
-        terms_to_show = []
-        cache_key = f"terms_to_show_cache_{article_id}"
-        cached_terms = st.session_state.get(cache_key)
-        if cached_terms is not None:
-            terms_to_show = cached_terms
-            perf_steps["terms_filter_ms"] = 0  # 캐시 히트
-        elif matched_terms_from_highlight:
-            # ✅ 성능 개선: 하이라이트 처리에서 이미 발견된 용어 사용 (추가 필터링 불필요)
-            terms_to_show = list(matched_terms_from_highlight)
-            if article_id:
-                st.session_state[cache_key] = terms_to_show
-            perf_steps["terms_filter_ms"] = int((time.time() - terms_filter_start) * 1000)
-        else:
-            # Fallback: 하이라이트에서 용어를 찾지 못한 경우 (드문 경우)
-            content_lower = content.lower()
-            highlight_terms_set = st.session_state.get("rag_terms_for_highlight")
-            if highlight_terms_set:
-                terms_set = set()
-                for term in highlight_terms_set:
-                    if term and term.lower() in content_lower:
-                        terms_set.add(term)
-                terms_to_show = list(terms_set)
-            elif st.session_state.get("rag_initialized", False):
-                try:
-                    metadata_map = st.session_state.get("rag_metadata_by_term")
-                    if metadata_map:
-                        terms_set = set()
-                        seen_terms = set()
-                        for term_key, metadata in metadata_map.items():
-                            original_term = metadata.get('term', '').strip()
-                            if original_term and original_term not in seen_terms:
-                                seen_terms.add(original_term)
-                                if original_term.lower() in content_lower:
-                                    terms_set.add(original_term)
-                        terms_to_show = list(terms_set)
-                    else:
-                        collection = st.session_state.rag_collection
-                        all_data = collection.get()
-                        if all_data and all_data['metadatas']:
-                            terms_set = set()
-                            for metadata in all_data['metadatas']:
-                                term = metadata.get('term', '').strip()
-                                if term and term.lower() in content_lower:
-                                    terms_set.add(term)
-                            terms_to_show = list(terms_set)
-                except Exception as e:
-                    terms_to_show = [t for t in st.session_state.financial_terms.keys() if t.lower() in content_lower]
-            else:
-                terms_to_show = [t for t in st.session_state.financial_terms.keys() if t.lower() in content_lower]
-            
-            if article_id:
-                st.session_state[cache_key] = terms_to_show
-            perf_steps["terms_filter_ms"] = int((time.time() - terms_filter_start) * 1000)
-        
-        perf_steps["terms_count"] = len(terms_to_show)
+    # ✅ 성능 개선: 첫 진입/재렌더가 같은 렌더 경로 하나를 공유 (로그/타이머만 첫 진입에서 추가)
+    # 컨텐츠에 문단 구분이 없으면 자동으로 문단 생성 (_format_paragraphs는 lru_cache)
+    content = _format_paragraphs(article['content'])
 
-        # ✅ 성능 측정: 전체 렌더링 시간
-        total_latency_ms = int((time.time() - t0) * 1000)
-        perf_steps["total_ms"] = total_latency_ms
-        perf_steps["content_length"] = len(content)
-        perf_steps["highlighted_length"] = len(highlighted_content)
-        
-        # 렌더 완료 → 상세 성능 정보와 함께 로그 기록
-        log_event(
-            "news_detail_open",
-            news_id=article_id,
-            surface="detail",
-            title=article.get("title"),
-            latency_ms=total_latency_ms,
-            note="기사 렌더링 완료",
-            payload={
-                "article_id": article_id,
-                "perf_steps": perf_steps,  # 단계별 성능 정보
-                "cache_hit": cached_terms is not None or highlight_cache_hit,  # ✅ 용어 목록 캐시 또는 하이라이트 캐시 히트
-                "highlight_cache_hit": highlight_cache_hit,  # 하이라이트 캐시 히트 여부
-                "terms_cache_hit": cached_terms is not None,  # 용어 목록 캐시 히트 여부
+    # ✅ 성능 측정: 하이라이트 처리 시간
+    highlight_start = time.perf_counter_ns()
+    # ✅ 성능 개선: 하이라이트 처리에서 발견된 용어를 그대로 용어 버튼 목록으로 사용 (st.cache_data 캐시 조회)
+    highlighted_content, terms_to_show = _highlight_article(content, article_id)
+    highlight_elapsed_ms = _elapsed_ms(highlight_start)
+
+    # 실제 렌더링
+    _render_article_body(article, highlighted_content)
+
+    if first_entry:
+        # ✅ 성능 개선: 로그를 기록할 곳이 없으면 성능 정보 dict/payload 구성과 log_event 호출 생략
+        if is_logging_enabled():
+            # ✅ 하이라이트 캐시 히트 추정: 처리 시간이 5ms 이하면 캐시 히트로 간주
+            highlight_cache_hit = highlight_elapsed_ms <= 5
+            # 용어 목록은 하이라이트 결과에서 함께 나오므로 캐시 히트 여부도 동일
+            terms_cache_hit = highlight_cache_hit
+
+            # ✅ 성능 측정: 전체 렌더링 시간
+            total_latency_ms = _elapsed_ms(t0)
+            perf_steps = {  # 성능 측정 단계별 시간
+                "highlight_ms": highlight_elapsed_ms,
+                "terms_filter_ms": 0,  # 별도 필터링 단계 없음 (하이라이트에서 함께 계산)
+                "terms_count": len(terms_to_show),
+                "total_ms": total_latency_ms,
+                "content_length": len(content),
+                "highlighted_length": len(highlighted_content),
             }
-        )
+
+            # 렌더 완료 → 상세 성능 정보와 함께 로그 기록
+            log_event(
+                "news_detail_open",
+                news_id=article_id,
+                surface="detail",
+                title=article.get("title"),
+                latency_ms=total_latency_ms,
+                note="기사 렌더링 완료",
+                payload={
+                    "article_id": article_id,
+                    "perf_steps": perf_steps,  # 단계별 성능 정보
+                    "cache_hit": terms_cache_hit or highlight_cache_hit,  # ✅ 용어 목록 캐시 또는 하이라이트 캐시 히트
+                    "highlight_cache_hit": highlight_cache_hit,  # 하이라이트 캐시 히트 여부
+                    "terms_cache_hit": terms_cache_hit,  # 용어 목록 캐시 히트 여부
+                }
+            )
 
         # 플래그 설정(중복 기록 방지)
         st.session_state.detail_enter_logged = True
-        st.session_state.page_enter_time = datetime.now()
-
-    else:
-        # ✅ 재렌더 시에는 캐시된 하이라이트 컨텐츠 사용 (성능 최적화)
-        article_id = article.get("id")
-        highlight_cache_key = f"article_highlight_cache_{article_id}"
-        
-        # 캐시된 하이라이트 컨텐츠가 있으면 재사용 (하이라이트 처리 생략)
-        cached_highlight = st.session_state.get(highlight_cache_key)
-        
-        if cached_highlight:
-            # 캐시 히트: 하이라이트 처리 생략 (거의 0ms)
-            highlighted_content = cached_highlight
-        else:
-            # 캐시 미스: 하이라이트 처리 (하지만 이미 highlight_terms 내부 캐시 활용)
-            content = article['content']
-            highlighted_content = highlight_terms(content, article_id=str(article_id) if article_id else None)
-            
-            # 하이라이트 결과를 캐시에 저장 (다음 재렌더링 시 즉시 사용)
-            if article_id:
-                st.session_state[highlight_cache_key] = highlighted_content
-        
-        # UI 렌더링 (항상 실행하되, 하이라이트는 캐시에서 가져옴)
-        st.markdown("---")
-        st.header(article['title'])
-        st.caption(f"📅 {article['date']}")
-        st.markdown('<div class="article-content">', unsafe_allow_html=True)
-        st.markdown(highlighted_content, unsafe_allow_html=True)
-        st.markdown('</div>', unsafe_allow_html=True)
-        if article.get("url"):
-            st.markdown(f"[🔗 기사 원문 보기]({article['url']})")
+        st.session_state.page_enter_time_ns = time.perf_counter_ns()  # ✅ 성능 개선: 단조 시계 정수 (로그 전송 시에만 변환)
 
     # ✅ 성능 개선: is_page_hidden_eval() 호출 최소화 (뒤로가기 버튼 클릭 시에만 체크)
     # 탭 전환 등으로 페이지가 숨겨지면 종료하는 로직은 제거 (필요시에만 활성화)
 
 
     # ← 뒤로가기 버튼 : 목록으로
-    if st.button("← 뉴스 목록으로 돌아가기"):
-        # ✅ 성능 측정: 뒤로가기 처리 시간
-        back_start = time.time()
-        
-        # ✅ 로그 중복 제거: end_view_timer() 내부 로그와 통합
-        duration_sec = None
-        max_depth_pct = None
-        if st.session_state.get("detail_enter_logged"):
-            # end_view_timer() 내부에서 계산하는 정보를 직접 가져옴
-            if "view_start_time" in st.session_state:
-                duration_sec = time.time() - st.session_state["view_start_time"]
-            news_id = st.session_state.get("view_news_id", article.get("id"))
-            max_depth_pct = st.session_state.get("detail_max_depth_pct", 0.0)
-            
-            # end_view_timer() 호출 (내부 로그는 기록하지 않도록 수정 필요하지만,
-            # 일단 여기서 통합 로그로 기록하므로 중복은 제거됨)
-            # 세션 상태만 정리
-            for k in ("view_start_time", "view_news_id", "detail_max_depth_pct"):
-                if k in st.session_state:
-                    del st.session_state[k]
-            
-            st.session_state.detail_enter_logged = False
-        
-        # ✅ 통합 로그 1번만 기록 (view_duration + news_detail_back 정보 포함)
-        log_event(
-            "news_detail_back", 
-            news_id=article.get("id"), 
-            surface="detail",
-            payload={
-                "back_process_ms": int((time.time() - back_start) * 1000),
-                "duration_sec": round(duration_sec, 2) if duration_sec is not None else None,
-                "max_depth_pct": round(max_depth_pct, 1) if max_depth_pct is not None else None,
-            }
-        )
-        
-        st.session_state.selected_article = None
-        st.session_state.detail_enter_logged = False
-        st.rerun()
+    # ✅ 성능 개선: on_click 콜백으로 처리해 클릭 rerun에서 상세 페이지를 다시 그린 뒤 st.rerun()하지 않고 바로 목록 표시
+    st.button("← 뉴스 목록으로 돌아가기", on_click=_on_back_click, args=(article,))
 
     # 용어 설명 UI
     st.info("💡 아래 버튼에서 용어를 선택하면 챗봇이 쉽게 설명해드립니다!")
     st.subheader("🔍 용어 설명 요청")
 
-    # ✅ 성능 개선: 용어 목록은 이미 위에서 계산됨 (재렌더 시에는 캐시에서 가져오기)
-    if not st.session_state.get("detail_enter_logged"):
-        # 첫 렌더링 시에는 이미 terms_to_show가 계산됨
-        pass
+    # 버튼 렌더링 (3열 그리드)
+    # ✅ 성능 개선: 행 단위로 잘라 zip으로 채움 (셀마다 인덱스 계산/범위 검사 제거)
+    #              행마다 st.columns(3)을 두어 용어 라벨이 줄바꿈돼도 행이 어긋나지 않고,
+    #              좁은 화면에서 열이 세로로 쌓여도 정렬 순서 그대로 표시
+    # ✅ 성능 개선: 처음에는 TERM_BUTTON_LIMIT개만 위젯으로 만들고, 나머지는 "더 보기"를 누른 기사에서만 생성
+    article_key = article_id or article.get("title")
+    if st.session_state.get("terms_show_all_for") == article_key:
+        visible_terms = terms_to_show
     else:
-        # 재렌더 시에는 캐시에서 가져오기
-        article_id = article.get("id")
-        cache_key = f"terms_to_show_cache_{article_id}"
-        cached_terms = st.session_state.get(cache_key)
-        if cached_terms is not None:
-            terms_to_show = cached_terms
-        else:
-            # 캐시가 없으면 다시 계산 (드문 경우)
-            content_lower = article['content'].lower()
-            if st.session_state.get("rag_initialized", False):
-                try:
-                    metadata_map = st.session_state.get("rag_metadata_by_term")
-                    if metadata_map:
-                        terms_set = set()
-                        for term_key, metadata in metadata_map.items():
-                            original_term = metadata.get('term', '').strip()
-                            if original_term and original_term.lower() in content_lower:
-                                terms_set.add(original_term)
-                        terms_to_show = list(terms_set)
-                    else:
-                        collection = st.session_state.rag_collection
-                        all_data = collection.get()
-                        if all_data and all_data['metadatas']:
-                            terms_set = set()
-                            for metadata in all_data['metadatas']:
-                                term = metadata.get('term', '').strip()
-                                if term and term.lower() in content_lower:
-                                    terms_set.add(term)
-                            terms_to_show = list(terms_set)
-                except Exception as e:
-                    terms_to_show = [t for t in st.session_state.financial_terms.keys() if t.lower() in content_lower]
-            else:
-                terms_to_show = [t for t in st.session_state.financial_terms.keys() if t.lower() in content_lower]
-            
-            if article_id:
-                st.session_state[cache_key] = terms_to_show
+        visible_terms = terms_to_show[:TERM_BUTTON_LIMIT]
+    for row_start in range(0, len(visible_terms), 3):
+        row_terms = visible_terms[row_start:row_start + 3]
+        for col, term in zip(st.columns(3), row_terms):
+            with col:
+                _term_button(term, article)
 
-    # 버튼 렌더링 (3열 그리드)
-    for i in range(0, len(terms_to_show), 3):
-        cols = st.columns(3)
-        for j, col in enumerate(cols):
-            if i + j < len(terms_to_show):
-                term = terms_to_show[i + j]
-                with col:
-                    if st.button(f"📌 {term}", key=f"term_btn_{term}", use_container_width=True):
-                        # ✅ 성능 측정: 용어 클릭 전체 처리 시간
-                        term_click_start = time.time()
-                        st.session_state.term_click_count += 1
-
-                        user_question = f"'{term}' 용어를 설명해주세요"
-                        # 대화 히스토리 (사용자 발화 1회만 기록)
-                        st.session_state.chat_history.append({"role": "user", "content": user_question})
-
-                        # ✅ 성능 측정: 설명 생성 시간
-                        explanation_start = time.time()
-                        explanation, rag_info = explain_term(term, st.session_state.chat_history, return_rag_info=True)
-                        explanation_latency_ms = int((time.time() - explanation_start) * 1000)
-                        
-                        # ✅ 성능 측정: 전체 처리 시간
-                        total_latency_ms = int((time.time() - term_click_start) * 1000)
-
-                        # 클릭(자동 질문 포함) 이벤트 로그 (상세 성능 정보 포함)
-                        log_event(
-                            "glossary_click",
-                            term=term,
-                            news_id=article.get("id"),
-                            source="news_highlight",
-                            surface="detail",
-                            message=user_question,
-                            click_count=st.session_state.term_click_count,
-                            latency_ms=total_latency_ms,  # 전체 처리 시간
-                            payload={
-                                "term": term,
-                                "news_id": article.get("id"),
-                                "perf_steps": {
-                                    "explanation_ms": explanation_latency_ms,  # 설명 생성 시간
-                                    "total_ms": total_latency_ms,  # 전체 처리 시간
-                                    "answer_length": len(explanation),  # 답변 길이
-                                },
-                                "rag_info": rag_info,  # RAG 정보
-                            }
-                        )
-
-                        # 답변 히스토리 + 답변 이벤트 로그
-                        st.session_state.chat_history.append({"role": "assistant", "content": explanation})
-                        log_event(
-                            "glossary_answer",
-                            term=term,
-                            source="news_highlight",
-                            surface="detail",
-                            message=user_question,
-                            answer_len=len(explanation),
-                            latency_ms=explanation_latency_ms,  # 설명 생성 시간
-                            via="rag",
-                            rag_info=rag_info,
-                            response=explanation,
-                            payload={
-                                "term": term,
-                                "news_id": article.get("id"),
-                                "perf_steps": {
-                                    "explanation_ms": explanation_latency_ms,
-                                    "total_ms": total_latency_ms,
-                                    "answer_length": len(explanation),
-                                },
-                                "rag_info": rag_info,
-                            }
-                        )
-
-                        st.rerun()
+    hidden_count = len(terms_to_show) - len(visible_terms)
+    if hidden_count > 0:
+        st.button(
+            f"➕ 용어 {hidden_count}개 더 보기",
+            key="terms_show_more",
+            on_click=_show_all_terms,
+            args=(article_key,),
+        )
 
     st.caption("💡 Tip: 버튼을 누르면 오른쪽 챗봇에서 상세 설명을 볼 수 있어요!")
@@ -4,18 +4,57 @@ import time
 import textwrap
 import os
 import base64
+from functools import lru_cache
 import streamlit as st
 from streamlit.components.v1 import html as st_html
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from core.logger import log_event
-from rag.glossary import explain_term, search_terms_by_rag
+from rag.glossary import explain_term, search_terms_by_rag, load_rag_exact_term_index
+from rag.term_index import get_term_index
 from core.utils import llm_chat, extract_urls_from_text, detect_article_search_request, detect_inappropriate_question
 from data.news import parse_news_from_url, search_news_from_supabase
 from persona.persona import albwoong_persona_reply, generate_structured_persona_reply
 
 
+# 챗봇 패널에 유지/렌더링할 최근 메시지 수 (나머지는 chat_history_archive로 이동)
+CHAT_HISTORY_WINDOW = 50
+# "이전 대화 보기"에서 한 번에 보여줄 아카이브 메시지 수
+CHAT_ARCHIVE_PAGE_SIZE = 20
+
+# ✅ 성능 개선: 챗봇 패널을 fragment로 렌더링
+# - 채팅 입력/초기화 등 패널 안의 상호작용은 패널만 다시 실행 (뉴스 목록·기사 본문은 재실행 안 함)
+# - st.fragment가 없는 구버전 Streamlit에서는 기존처럼 전체 rerun
+_st_fragment = getattr(st, "fragment", None)
+
+
+def _chat_fragment(func):
+    return _st_fragment(func) if _st_fragment is not None else func
+
+
+def _rerun_chat_panel():
+    """챗봇 패널만 다시 그리기 (채팅 이력만 바뀐 경우)"""
+    if _st_fragment is not None:
+        st.rerun(scope="fragment")
+    else:
+        st.rerun()
+
+
+# ✅ 성능 개선: 순수 HTML(말풍선 목록)은 st.html로 보내 Markdown 파싱을 건너뜀
+# - st.html이 없는 구버전 Streamlit에서는 기존처럼 st.markdown(unsafe_allow_html=True)
+_st_html = getattr(st, "html", None)
+
+
+def _render_html(html: str):
+    """Markdown 문법이 없는 HTML 조각 출력"""
+    if _st_html is not None:
+        _st_html(html)
+    else:
+        st.markdown(html, unsafe_allow_html=True)
+
+
+@st.cache_data(show_spinner=False)
 def get_albwoong_avatar_base64():
-    """알부엉 이미지를 Base64로 인코딩하여 반환"""
+    """알부엉 이미지를 Base64로 인코딩하여 반환 (파일은 프로세스당 한 번만 읽음)"""
     possible_paths = [
         "assets/albwoong.png",
         "assets/albueong.png",
@@ -78,13 +117,73 @@ ALBWOONG_OPENERS = [
     "모르는 걸 물어보는 게 진짜 지혜야. 시작해볼까?"
 ]
 
-def render(terms: dict[str, dict], use_openai: bool = False):
+@lru_cache(maxsize=512)
+def _chat_bubble_html(role_class: str, content: str) -> str:
+    """채팅 말풍선 한 개의 HTML (내용은 이스케이프, 아바타 이미지는 CSS로 처리)"""
+    content_html = (
+        content
+        .replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace("\n", "<br>")
+    )
+    avatar_html = '<div class="chat-avatar chat-avatar--assistant"></div>' if role_class == "assistant" else ""
+    return textwrap.dedent(
+        f"""
+        <div class="chat-row chat-row--{role_class}">
+          {avatar_html}
+          <div class="chat-bubble chat-bubble--{role_class}">
+            {content_html}
+          </div>
+        </div>
+        """
+    ).strip()
+
+
+def _render_chat_archive_page(chat_archive: list[dict]):
+    """
+    이전 대화(아카이브)를 고정 크기 페이지 하나만 렌더링
+
+    - 페이지는 아카이브 앞에서부터 CHAT_ARCHIVE_PAGE_SIZE개씩 고정 구간이라
+      메시지가 뒤에 쌓여도 이미 찬 페이지의 내용은 바뀌지 않음
+    - 말풍선 HTML은 _chat_bubble_html 캐시를 재사용하므로 rerun 비용은 페이지 크기에 비례
+    - 채팅 컬럼(600px 고정) 안에서 입력창을 밀어내지 않도록 높이를 제한하고 내부 스크롤
+    """
+    page_count = (len(chat_archive) + CHAT_ARCHIVE_PAGE_SIZE - 1) // CHAT_ARCHIVE_PAGE_SIZE
+    page = st.session_state.get("chat_archive_page")
+    if page is None or not 0 <= page < page_count:
+        page = page_count - 1  # 기본은 가장 최근 페이지
+
+    start = page * CHAT_ARCHIVE_PAGE_SIZE
+    page_html = "".join(
+        _chat_bubble_html("user" if m["role"] == "user" else "assistant", m["content"])
+        for m in chat_archive[start:start + CHAT_ARCHIVE_PAGE_SIZE]
+    )
+    _render_html(
+        "<div class='chat-archive' style='max-height:180px; overflow-y:auto; padding-right:8px;'>"
+        + page_html
+        + "</div>"
+    )
+
+    if page_count > 1:
+        prev_col, next_col = st.columns(2)
+        with prev_col:
+            if st.button("◀ 더 이전", key="chat_archive_prev", disabled=page == 0):
+                st.session_state.chat_archive_page = page - 1
+                _rerun_chat_panel()
+        with next_col:
+            if st.button("다음 ▶", key="chat_archive_next", disabled=page == page_count - 1):
+                st.session_state.chat_archive_page = page + 1
+                _rerun_chat_panel()
+
+
+@_chat_fragment
+def render(terms: dict[str, dict]):
     """
     챗봇 패널 렌더링
     
     Args:
         terms: 금융 용어 사전 (dict[str, dict])
-        use_openai: OpenAI 사용 여부 (기본값: False)
     
     Features:
         - 플로팅 챗봇 UI (우측 하단 고정, 400px × 600px)
@@ -124,6 +223,28 @@ def render(terms: dict[str, dict], use_openai: bool = False):
     if "intro_shown" not in st.session_state:
         st.session_state.intro_shown = False
 
+    # ✅ 성능 개선: 화면에 그리는 대화는 최근 CHAT_HISTORY_WINDOW개로 제한
+    # 오래된 메시지는 chat_history_archive로 옮겨 rerun마다 다시 그리지 않음
+    overflow = len(st.session_state.chat_history) - CHAT_HISTORY_WINDOW
+    if overflow > 0:
+        st.session_state.setdefault("chat_history_archive", []).extend(
+            st.session_state.chat_history[:overflow]
+        )
+        st.session_state.chat_history = st.session_state.chat_history[overflow:]
+
+    # 이전 대화는 "이전 대화 보기"를 눌렀을 때만 CHAT_ARCHIVE_PAGE_SIZE개 단위 페이지로 표시
+    # (닫혀 있으면 아카이브 HTML을 만들지도, 보내지도 않음 - expander는 접혀 있어도 내용을 전송함)
+    chat_archive = st.session_state.get("chat_history_archive") or []
+    if chat_archive:
+        archive_open = st.session_state.get("chat_archive_open", False)
+        toggle_label = "이전 대화 닫기" if archive_open else f"이전 대화 {len(chat_archive)}개 보기"
+        if st.button(toggle_label, key="chat_archive_toggle"):
+            st.session_state.chat_archive_open = not archive_open
+            st.session_state.chat_archive_page = None
+            _rerun_chat_panel()
+        if archive_open:
+            _render_chat_archive_page(chat_archive)
+
     # ── NEW: 첫 진입 시(또는 리셋 후) 알부엉 인사말 1회 자동 출력 ──
     if not st.session_state.intro_shown and len(st.session_state.chat_history) == 0:
         import random
@@ -135,51 +256,35 @@ def render(terms: dict[str, dict], use_openai: bool = False):
         })
         st.session_state.intro_shown = True
 
-    # 대화 히스토리 렌더(기존 그대로)
+    # 대화 히스토리 렌더
+    # ✅ 성능 개선: 메시지마다 아바타 이미지(Base64)를 반복 삽입하지 않고 CSS로 한 번만 내려보냄
+    #              메시지 HTML은 (역할, 내용) 단위로 캐시해 rerun마다 다시 만들지 않음
     messages_html = []
     article_buttons = []  # 기사 버튼을 별도로 저장
     for idx, message in enumerate(st.session_state.chat_history):
         role = message["role"]
         role_class = "user" if role == "user" else "assistant"
-        content_html = (
-            message["content"]
-            .replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-            .replace("\n", "<br>")
-        )
-        avatar_html = ""
-        if role_class == "assistant":
-            avatar_img_src = get_albwoong_avatar_base64()
-            if avatar_img_src:
-                avatar_html = f'''<div class="chat-avatar chat-avatar--assistant"><img src="{avatar_img_src}" alt="알부엉" style="width: 100%; height: 100%; object-fit: cover; border-radius: 50%;"></div>'''
-            else:
-                avatar_html = '<div class="chat-avatar chat-avatar--assistant"></div>'
-
-        messages_html.append(
-            textwrap.dedent(
-                f"""
-                <div class="chat-row chat-row--{role_class}">
-                  {avatar_html}
-                  <div class="chat-bubble chat-bubble--{role_class}">
-                    {content_html}
-                  </div>
-                </div>
-                """
-            ).strip()
-        )
+        messages_html.append(_chat_bubble_html(role_class, message["content"]))
         
         # 기사 목록이 있는 메시지인 경우 버튼 생성
         if role == "assistant" and "articles" in message and message["articles"]:
             article_buttons.append((idx, message["articles"]))
 
+    avatar_img_src = get_albwoong_avatar_base64()
+    avatar_css = (
+        "<style>.chat-message-container .chat-avatar--assistant,.chat-archive .chat-avatar--assistant{"
+        f"background-image:url('{avatar_img_src}');background-size:cover;background-position:center;"
+        "}</style>"
+        if avatar_img_src else ""
+    )
     chat_html = (
-        "<div id='chat-scroll-box' class='chat-message-container' "
+        avatar_css
+        + "<div id='chat-scroll-box' class='chat-message-container' "
         "style='overflow-y:auto; padding-right:8px; flex: 1; min-height: 0;'>"
         + "".join(messages_html)
         + "<div id='chat-scroll-anchor'></div></div>"
     )
-    st.markdown(chat_html, unsafe_allow_html=True)
+    _render_html(chat_html)
     
     # 기사 버튼 표시 (가장 최근 검색 결과만 표시)
     if article_buttons:
@@ -216,7 +321,7 @@ def render(terms: dict[str, dict], use_openai: bool = False):
                         "search_keyword": search_keyword
                     }
                 )
-                st.rerun()
+                st.rerun()  # 기사 선택은 메인 화면 전환이므로 전체 rerun
     
     st_html(
         """
@@ -475,7 +580,7 @@ def render(terms: dict[str, dict], use_openai: bool = False):
                             }
                         )
                         
-                        st.rerun()
+                        _rerun_chat_panel()
                     else:
                         explanation = "❌ 기사를 가져올 수 없었어. URL을 확인해줘. 🦉"
                         st.session_state.chat_history.append({"role": "assistant", "content": explanation})
@@ -488,7 +593,7 @@ def render(terms: dict[str, dict], use_openai: bool = False):
                                 "error": "파싱 실패"
                             }
                         )
-                        st.rerun()
+                        _rerun_chat_panel()
                         
                 except Exception as e:
                     explanation = f"❌ 오류가 발생했어요: {str(e)} 🦉"
@@ -502,7 +607,7 @@ def render(terms: dict[str, dict], use_openai: bool = False):
                             "error": str(e)
                         }
                     )
-                    st.rerun()
+                    _rerun_chat_panel()
             
             # URL 처리 완료 후 함수 종료
             return
@@ -555,7 +660,7 @@ def render(terms: dict[str, dict], use_openai: bool = False):
                         }
                     )
                     
-                    st.rerun()
+                    _rerun_chat_panel()
                 else:
                     # 기사를 찾지 못함
                     explanation = f"'{keyword}'와 관련된 기사는 찾지 못했어. 다른 키워드로 시도해봐."
@@ -569,7 +674,7 @@ def render(terms: dict[str, dict], use_openai: bool = False):
                             "source": "chat"
                         }
                     )
-                    st.rerun()
+                    _rerun_chat_panel()
             
             # 기사 찾기 처리 완료 후 함수 종료
             return
@@ -586,7 +691,7 @@ def render(terms: dict[str, dict], use_openai: bool = False):
                     "reason": "투자 조언 또는 부적절한 질문"
                 }
             )
-            st.rerun()
+            _rerun_chat_panel()
             return
 
         explanation = None
@@ -601,24 +706,18 @@ def render(terms: dict[str, dict], use_openai: bool = False):
                 if collection is None:
                     raise ValueError("RAG 컬렉션이 없습니다")
                 
-                all_data = collection.get()
+                # ✅ 성능 개선: 매 질문마다 collection.get()으로 전체 컬렉션을 읽지 않고 캐시된 용어 맵 사용
+                # ✅ 성능 개선: 용어 인덱스는 세션에 한 번 만들어 두고 재사용 (질문마다 용어 튜플 재구성/해시 없음)
+                rag_term_index = load_rag_exact_term_index(collection)
 
-                if all_data and all_data['metadatas']:
+                if rag_term_index is not None:
                     # 정확한 용어 매칭 시도 (조사/문장부호 포함)
-                    def _term_exact_match(text: str, term: str) -> bool:
-                        if not term:
-                            return False
-                        lookahead = r"(?=($|\s|[?!.,]|[은는이가을를과와로도의]))"
-                        pattern = rf"(^|\s){re.escape(term)}{lookahead}"
-                        return re.search(pattern, text, re.IGNORECASE) is not None
-
-                    for metadata in all_data['metadatas']:
-                        rag_term = metadata.get('term', '').strip()
-
-                        if _term_exact_match(user_input, rag_term):
-                            matched_term = rag_term
-                            is_financial_question = True
-                            break
+                    # ✅ 성능 개선: 용어마다 정규식을 만들어 검사하지 않고, 캐시된 다중 패턴 인덱스로 한 번에 스캔
+                    #              (질문에서 가장 앞에 나온 용어가 매칭됨)
+                    rag_term = rag_term_index.find_first_word(user_input)
+                    if rag_term:
+                        matched_term = rag_term
+                        is_financial_question = True
 
                     # 정확 매칭 실패 시 벡터 검색으로 유사 용어 찾기 (단, 금융 관련 키워드가 있을 때만)
                     if not matched_term:
@@ -674,29 +773,27 @@ def render(terms: dict[str, dict], use_openai: bool = False):
                 st.warning(f"⚠️ RAG 검색 중 오류 발생: {e}")
 
         # 2) RAG 실패 시: 하드코딩된 사전에서 정확한 매칭 시도
+        # ✅ 성능 개선: 용어마다 정규식을 만들어 검색하지 않고, 캐시된 다중 패턴 인덱스로 한 번에 검색
         if explanation is None and not is_financial_question:
-            for term_key in terms.keys():
-                lookahead = r"(?=($|\s|[?!.,]|[은는이가을를과와로도의]))"
-                pattern = rf"(^|\s){re.escape(term_key)}{lookahead}"
-                if re.search(pattern, user_input, re.IGNORECASE):
-                    explanation, rag_info = explain_term(
-                        term_key,
-                        st.session_state.chat_history,
-                        return_rag_info=True,
-                    )
-                    is_financial_question = True
-                    log_event(
-                        "glossary_answer",
-                        term=term_key,
-                        source="chat",
-                        surface="sidebar",
-                        message=user_input,  # ✅ 사용자 질문
-                        answer_len=len(explanation),
-                        via="rag",
-                        rag_info=rag_info,  # RAG 정보 전달
-                        response=explanation  # 시스템 응답(설명)
-                    )
-                    break
+            term_key = get_term_index(tuple(terms.keys())).find_first_word(user_input)
+            if term_key:
+                explanation, rag_info = explain_term(
+                    term_key,
+                    st.session_state.chat_history,
+                    return_rag_info=True,
+                )
+                is_financial_question = True
+                log_event(
+                    "glossary_answer",
+                    term=term_key,
+                    source="chat",
+                    surface="sidebar",
+                    message=user_input,  # ✅ 사용자 질문
+                    answer_len=len(explanation),
+                    via="rag",
+                    rag_info=rag_info,  # RAG 정보 전달
+                    response=explanation  # 시스템 응답(설명)
+                )
 
         # 3) 금융 용어가 아닌 일반 질문: 질문 패턴에 따라 답변 형식 결정
         if explanation is None and not is_financial_question:
@@ -888,12 +985,15 @@ def render(terms: dict[str, dict], use_openai: bool = False):
             """,
             height=0,
         )
-        st.rerun()
+        _rerun_chat_panel()
 
     # 대화 초기화(변경)
     if st.button("🔄 대화 초기화"):
         log_event("chat_reset", surface="sidebar")
         st.session_state.chat_history = []
+        st.session_state.chat_history_archive = []
+        st.session_state.chat_archive_open = False
+        st.session_state.chat_archive_page = None
         # ── NEW: 다음 렌더에서 다시 인사말 나오도록 ──
         st.session_state.intro_shown = False
-        st.rerun()
+        _rerun_chat_panel()
@@ -1,18 +1,52 @@
 
 from core.config import LOG_FILE, LOG_DIR
-from core.utils import load_logs_as_df
+from core.logger import LEGACY_EVENT_ALIASES
+from core.utils import load_logs_as_df_cached, read_log_tail_lines
 import streamlit as st
 import pandas as pd
+import numpy as np
 import os
 from datetime import datetime
+from itertools import islice
+
+def _session_gap_seconds(df: pd.DataFrame) -> pd.Series:
+    """
+    세션별로 다음 이벤트까지의 간격(초)을 전체 프레임에 대해 한 번에 계산
+    - ✅ 성능 개선: 세션을 고를 때마다 슬라이스를 복사해 간격을 다시 계산하지 않고, 한 번 구해 둔 열을 필터링만 함
+    - 세션의 마지막 이벤트(다음 이벤트 없음)와 session_id가 없는 행은 NaN
+    """
+    next_time = df.groupby("session_id", observed=True, sort=False)["event_time"].shift(-1)
+    return (next_time - df["event_time"]).dt.total_seconds()
+
+
+LOG_PAGE_SIZE = 500
+
+
+def _paged_dataframe(df: pd.DataFrame, key: str, height: int = 420, page_size: int = LOG_PAGE_SIZE) -> None:
+    """
+    큰 로그 표를 페이지 단위로 표시
+    - ✅ 성능 개선: rerun마다 전체 행을 브라우저로 직렬화하지 않고 현재 페이지(page_size행)만 전송
+    """
+    n_pages = max(1, -(-len(df) // page_size))
+    page = 1
+    if n_pages > 1:
+        page = int(st.number_input(
+            f"페이지 (1~{n_pages}, 페이지당 {page_size:,}행)",
+            min_value=1, max_value=n_pages, value=1, step=1, key=key,
+        ))
+    start = (page - 1) * page_size
+    st.dataframe(df.iloc[start:start + page_size], use_container_width=True, height=height)
+    if n_pages > 1:
+        st.caption(f"전체 {len(df):,}행 중 {start + 1:,}~{min(start + page_size, len(df)):,}행 표시 중")
+
 
 def show_log_viewer():
     st.markdown("## 🧪 로그 뷰어 (MVP)")
-    df = load_logs_as_df(LOG_FILE)
+    df = load_logs_as_df_cached(LOG_FILE)
     if df.empty:
         st.info("아직 로그 파일이 없습니다. (logs/events.csv)")
         return
-    st.dataframe(df, use_container_width=True, height=420)
+    _paged_dataframe(df, key="log_viewer_mvp_page")
 
 
 def render():
@@ -23,7 +57,7 @@ def render():
         st.caption("이벤트가 발생하면 자동으로 생성됩니다.")
         return
 
-    df = load_logs_as_df(LOG_FILE)
+    df = load_logs_as_df_cached(LOG_FILE)
     if df.empty:
         st.info("로그 파일이 비어있습니다.")
         return
@@ -60,9 +94,11 @@ def render():
     df_view = df_view.copy()
     df_view["event_time"] = df_view["event_time_kst"].dt.tz_localize(None)
     df_view.drop(columns=["event_time_kst"], inplace=True, errors="ignore")
+    df_view["gap_sec"] = _session_gap_seconds(df_view)
 
+    n_sessions = df_view["session_id"].nunique()
     st.caption(
-        f"필터: {selected_range} / 이벤트 {len(df_view):,}건 / 세션 {df_view['session_id'].nunique()}개"
+        f"필터: {selected_range} / 이벤트 {len(df_view):,}건 / 세션 {n_sessions}개"
     )
 
     col_info1, col_info2, col_info3 = st.columns(3)
@@ -90,24 +126,45 @@ def render():
         st.info("선택한 기간에 해당하는 로그가 없습니다.")
         return
 
+    # ✅ 성능 개선: event_name 컬럼을 한 번만 훑어 건수/이벤트별 프레임을 만들어 두고 재사용
+    event_counts = df_view["event_name"].value_counts()
+    event_counts = event_counts[event_counts > 0]  # category 컬럼은 빈 범주를 0으로 포함함
+    df_by_event = dict(tuple(df_view.groupby("event_name", observed=True)))
+    empty_events = df_view.iloc[0:0]
+
+    # glossary_click / glossary_answer는 통합 이벤트(glossary_interaction) 행도 함께 집계
+    def _event_names(name: str) -> tuple:
+        return (name,) + LEGACY_EVENT_ALIASES.get(name, ())
+
+    def _events(name: str) -> pd.DataFrame:
+        frames = [df_by_event[n] for n in _event_names(name) if n in df_by_event]
+        if not frames:
+            return empty_events
+        if len(frames) == 1:
+            return frames[0]
+        return pd.concat(frames).sort_values("event_time")
+
+    def _count(name: str) -> int:
+        return sum(int(event_counts.get(n, 0)) for n in _event_names(name))
+
     # ===== 상단 요약 (세션 기준 기본 뷰) =====
     colA, colB, colC, colD = st.columns(4)
     with colA:
         st.metric("총 이벤트", f"{len(df_view):,}")
     with colB:
-        st.metric("세션 수", df_view["session_id"].nunique())
+        st.metric("세션 수", n_sessions)
     with colC:
         st.metric("유저 수", df_view["user_id"].nunique())
     with colD:
-        st.metric("이벤트 종류", df_view["event_name"].nunique())
+        st.metric("이벤트 종류", len(event_counts))
 
     colE1, colE2, colE3 = st.columns(3)
     with colE1:
-        st.metric("뉴스 클릭", int((df_view["event_name"] == "news_click").sum()))
+        st.metric("뉴스 클릭", _count("news_click"))
     with colE2:
-        st.metric("챗 질문", int((df_view["event_name"] == "chat_question").sum()))
+        st.metric("챗 질문", _count("chat_question"))
     with colE3:
-        st.metric("RAG 답변", int((df_view["event_name"] == "glossary_answer").sum()))
+        st.metric("RAG 답변", _count("glossary_answer"))
 
     st.markdown("### 🔄 전환 퍼널 요약")
     funnel_dimension = "기준 이벤트"
@@ -118,10 +175,10 @@ def render():
         earliest = pivot_event["event_time"].min()
         return int((event_list["event_time"] >= earliest).sum())
 
-    click_events = df_view[df_view["event_name"] == "news_click"]
-    detail_events = df_view[df_view["event_name"] == "news_detail_open"]
-    chat_events = df_view[df_view["event_name"] == "chat_question"]
-    rag_events = df_view[df_view["event_name"] == "glossary_answer"]
+    click_events = _events("news_click")
+    detail_events = _events("news_detail_open")
+    chat_events = _events("chat_question")
+    rag_events = _events("glossary_answer")
 
     base_count = len(click_events)
     detail_count = _count_after(detail_events, click_events)
@@ -175,8 +232,10 @@ def render():
 
     if agg_by_user:
         # 유저 단위 집계
+        # ✅ 성능 개선: 같은 GroupBy를 요약과 드릴다운에 재사용 (선택할 때마다 전체 마스크 스캔 제거)
+        user_groups = df_view.groupby("user_id", dropna=False, sort=False, observed=True)
         g = (
-            df_view.groupby("user_id", dropna=False)
+            user_groups
               .agg(
                   events=("event_name", "count"),
                   sessions=("session_id", "nunique"),
@@ -206,29 +265,34 @@ def render():
         st.markdown("### 🔎 특정 유저 타임라인")
         target_user = st.selectbox("유저 선택", options=g["user_id"].tolist() if len(g) else [])
         if target_user:
-            udf = df_view[df_view["user_id"] == target_user].copy().sort_values("event_time")
+            # df_view는 이미 시간순 정렬되어 있으므로 그룹 추출만으로 타임라인 순서 유지
+            try:
+                udf = user_groups.get_group(target_user)
+            except KeyError:
+                udf = df_view.iloc[0:0]
 
             st.write(f"세션 수: {udf['session_id'].nunique()}개")
+            session_groups = udf.groupby("session_id", dropna=False, observed=True)
             sess_sum = (
-                udf.groupby("session_id", dropna=False)
+                session_groups
                    .agg(
                        events=("event_name","count"),
                        start=("event_time","min"),
                        end=("event_time","max")
                    )
-                   .assign(dwell_sec=lambda x: (x["end"] - x["start"]).dt.total_seconds())
+                   .assign(dwell_sec=lambda x: (
+                       x["end"].to_numpy(dtype="datetime64[ns]") - x["start"].to_numpy(dtype="datetime64[ns]")
+                   ) / np.timedelta64(1, "s"))
                    .sort_values("start", ascending=False)
             )
             st.dataframe(sess_sum, use_container_width=True, height=260)
 
             sel_sess = st.selectbox("세션 선택", options=sess_sum.index.tolist() if len(sess_sum) else [])
             if sel_sess:
-                sdf = udf[udf["session_id"] == sel_sess].copy()
-                sdf["next_time"] = sdf["event_time"].shift(-1)
-                sdf["gap_sec"] = (sdf["next_time"] - sdf["event_time"]).dt.total_seconds()
-                st.dataframe(
+                sdf = session_groups.get_group(sel_sess)
+                _paged_dataframe(
                     sdf[["event_time","event_name","surface","source","news_id","term","message","gap_sec"]],
-                    use_container_width=True, height=320
+                    key="log_viewer_user_session_page", height=320
                 )
 
         # 유저 기준 보기에서는 기본 탭 숨김
@@ -250,22 +314,22 @@ def render():
         show_recent_only = st.checkbox("최근 100개만 보기", value=False)
         display_df = df_view.tail(100) if show_recent_only else df_view
         
-        st.dataframe(display_df, use_container_width=True, height=420)
+        _paged_dataframe(display_df, key="log_viewer_all_page")
         
         if show_recent_only:
             st.caption(f"전체 {len(df_view):,}개 중 최근 100개만 표시 중입니다.")
 
     with tab2:
         st.caption("이벤트별 건수/최근 10건")
-        counts = df_view["event_name"].value_counts().rename_axis("event_name").reset_index(name="count")
+        counts = event_counts.rename_axis("event_name").reset_index(name="count")
         st.dataframe(counts, use_container_width=True, height=250)
         try:
             st.bar_chart(data=counts.set_index("event_name"))
         except Exception:
             pass
 
-        nc = (df_view["event_name"] == "news_click").sum()
-        ndo = (df_view["event_name"] == "news_detail_open").sum()
+        nc = _count("news_click")
+        ndo = _count("news_detail_open")
         conv = (ndo / nc * 100) if nc else 0
         st.write(f"**클릭→진입 전환율(rough)**: {conv:.1f}%  (clicks={nc}, opens={ndo})")
 
@@ -274,31 +338,31 @@ def render():
         session_ids = df_view["session_id"].dropna().unique().tolist()
         sess = st.selectbox("세션 선택", options=session_ids, index=0 if session_ids else None)
         if sess:
-            sdf = df_view[df_view["session_id"] == sess].copy().sort_values("event_time")
-            sdf["next_time"] = sdf["event_time"].shift(-1)
-            sdf["gap_sec"] = (sdf["next_time"] - sdf["event_time"]).dt.total_seconds()
-            st.dataframe(
+            # df_view는 이미 시간순 정렬되어 있고 gap_sec도 미리 계산되어 있으므로 필터링만 함
+            sdf = df_view[df_view["session_id"] == sess]
+            _paged_dataframe(
                 sdf[["event_time","event_name","surface","source","news_id","term","message","gap_sec"]],
-                use_container_width=True, height=420
+                key="log_viewer_session_page"
             )
 
     with tab4:
         st.caption("용어 클릭/응답 길이 통계")
-        gclick = df_view[df_view["event_name"] == "glossary_click"]
-        gans = df_view[df_view["event_name"] == "glossary_answer"]
+        gclick = _events("glossary_click")
+        gans = _events("glossary_answer")
 
         col1, col2 = st.columns(2)
         with col1:
             st.write("용어 클릭 Top N")
-            top_terms = gclick["term"].value_counts().head(10).rename_axis("term").reset_index(name="clicks")
+            term_clicks = gclick["term"].value_counts()
+            term_clicks = term_clicks[term_clicks > 0]  # category 컬럼의 빈 범주 제외
+            top_terms = term_clicks.head(10).rename_axis("term").reset_index(name="clicks")
             st.dataframe(top_terms, use_container_width=True, height=300)
 
         with col2:
             if "answer_len" in gans.columns:
-                tmp = gans.copy()
-                tmp["answer_len"] = pd.to_numeric(tmp["answer_len"], errors="coerce")
+                answer_len = pd.to_numeric(gans["answer_len"], errors="coerce")
                 agg = (
-                    tmp.groupby("term", dropna=True)["answer_len"]
+                    answer_len.groupby(gans["term"], dropna=True, observed=True)
                        .agg(["count","mean","max"])
                        .sort_values("count", ascending=False)
                        .head(10)
@@ -357,10 +421,15 @@ def render():
             st.caption("CSV 파일의 원본 내용을 확인할 수 있습니다.")
             
             preview_lines = st.slider("미리보기 줄 수", 1, 50, 10)
+            preview_from = st.radio("미리보기 위치", ["처음", "마지막"], horizontal=True)
             try:
-                with open(LOG_FILE, "r", encoding="utf-8-sig") as f:
-                    lines = f.readlines()[:preview_lines+1]
-                    st.code("".join(lines), language="csv")
+                # ✅ 성능 개선: 파일 전체를 readlines()로 읽지 않고 필요한 줄만 읽기
+                if preview_from == "마지막":
+                    lines = read_log_tail_lines(LOG_FILE, preview_lines)
+                else:
+                    with open(LOG_FILE, "r", encoding="utf-8-sig") as f:
+                        lines = list(islice(f, preview_lines + 1))
+                st.code("".join(lines), language="csv")
             except Exception as e:
                 st.error(f"파일 읽기 실패: {e}")
         else:
@@ -6,14 +6,17 @@ event_log 중심 모드에서는 Supabase에서 직접 데이터를 가져옵니
 
 from core.config import API_BASE_URL, API_ENABLE, SUPABASE_ENABLE
 from core.logger import _get_user_id, _get_backend_session_id, _ensure_backend_session, get_supabase_client
+from rag.term_index import get_term_index
 import streamlit as st
 import pandas as pd
 from typing import Optional, List, Dict, Any
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import json
 import importlib
 import re
 import os
+import traceback
+from urllib.parse import urlparse
 
 # wordcloud 라이브러리
 try:
@@ -250,9 +253,11 @@ def _get_term_from_row(row: pd.Series) -> Optional[str]:
 # 데이터 가져오기 함수들
 # ============================================================================
 
+@st.cache_data(ttl=30, show_spinner=False)  # 30초 캐시 (위젯 조작으로 인한 rerun마다 재조회 방지)
 def _fetch_news_from_supabase(limit: int = 1000) -> pd.DataFrame:
     """
     Supabase에서 news 테이블 데이터 가져오기
+    ✅ 최적화: st.cache_data로 rerun 간 결과 재사용 (필터/탭 변경 시 Supabase 재조회 없음)
     
     정렬 기준 (우선순위 순):
     1. published_at 최신순 (가장 중요 - 최신성 필수)
@@ -343,8 +348,27 @@ def _fetch_news_from_supabase(limit: int = 1000) -> pd.DataFrame:
         st.warning(f"⚠️ Supabase에서 뉴스 데이터 조회 실패: {str(e)}")
         return pd.DataFrame()
 
-def _fetch_event_logs_from_supabase(user_id: Optional[str] = None, limit: int = 1000) -> pd.DataFrame:
-    """Supabase에서 event_logs 데이터 가져오기 (페이지네이션 지원)"""
+@st.cache_data(ttl=30, show_spinner=False)  # 30초 캐시 (위젯 조작으로 인한 rerun마다 재조회 방지)
+def _fetch_event_logs_from_supabase(
+    user_id: Optional[str] = None,
+    limit: int = 1000,
+    days: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Supabase에서 event_logs 데이터 가져오기 (페이지네이션 지원)
+    ✅ 최적화: st.cache_data로 rerun 간 결과 재사용 (전체 페이지네이션 + payload 파싱을 매번 반복하지 않음)
+    ✅ 최적화: days가 주어지면 event_time >= now - days 조건을 붙여
+       event_time 인덱스 범위 스캔으로 필요한 기간만 조회
+
+    Args:
+        user_id: 특정 사용자만 조회 (None이면 전체)
+        limit: 최대 조회 건수 (999999 이상이면 전체)
+        days: 최근 N일만 조회 (None이면 전체 기간)
+    """
+    since_iso = None
+    if days:
+        since_iso = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+
     if not SUPABASE_ENABLE:
         return pd.DataFrame()
     
@@ -366,6 +390,9 @@ def _fetch_event_logs_from_supabase(user_id: Optional[str] = None, limit: int =
             if user_id:
                 query = query.eq("user_id", user_id)
             
+            if since_iso:
+                query = query.gte("event_time", since_iso)
+            
             query = query.order("event_time", desc=True)
             
             if fetch_all:
@@ -612,13 +639,23 @@ def render(show_mode: str = "dashboard"):
     Args:
         show_mode: "dashboard" (대시보드) 또는 "log_viewer" (로그 뷰어)
     """
-    from core.logger import _get_user_id
     
+    # 조회 기간 (기간을 좁히면 Supabase에서 event_time 인덱스 범위만 조회)
+    fetch_period_options = {"최근 1일": 1, "최근 7일": 7, "최근 30일": 30, "전체 기간": None}
+    fetch_period = st.selectbox(
+        "🗓️ 조회 기간",
+        list(fetch_period_options.keys()),
+        index=len(fetch_period_options) - 1,
+        key=f"event_log_fetch_period_{show_mode}",
+    )
+
     # Supabase에서 이벤트 로그 가져오기
     with st.spinner("🔄 Supabase에서 이벤트 로그를 가져오는 중..."):
         # 전체 데이터를 가져오기 위해 limit을 충분히 크게 설정
         # news 데이터와 동일하게 limit=999999로 설정하여 전체 데이터 가져오기
-        df = _fetch_event_logs_from_supabase(user_id=None, limit=999999)
+        df = _fetch_event_logs_from_supabase(
+            user_id=None, limit=999999, days=fetch_period_options[fetch_period]
+        )
 
         if df.empty:
             st.info("📭 아직 이벤트 로그가 없습니다. 앱을 사용하면 데이터가 수집됩니다.")
@@ -1422,7 +1459,6 @@ def _render_data_quality_consistency(news_df: pd.DataFrame):
             return set()
         
         # 한글, 영문, 숫자만 추출
-        import re
         keywords = re.findall(r'[가-힣a-zA-Z0-9]+', text_str)
         # 최소 길이 이상이고, 너무 일반적인 단어 제외
         stopwords = {'그', '이', '저', '것', '수', '때', '등', '및', '또', '또한', '그리고', 
@@ -1492,7 +1528,6 @@ def _render_data_quality_consistency(news_df: pd.DataFrame):
         
         # URL에서 도메인과 경로 키워드 추출
         try:
-            from urllib.parse import urlparse
             parsed = urlparse(url)
             domain = parsed.netloc.replace("www.", "")
             path = parsed.path
@@ -2107,16 +2142,8 @@ def _calculate_news_scores(news: Dict[str, Any]) -> Dict[str, float]:
         ]
     
     # RAG 용어 사전에 있는 용어가 뉴스에 포함된 개수 계산
-    # 긴 용어부터 매칭하여 부분 매칭 방지 (예: "기준금리"가 "금리"보다 먼저 매칭)
-    expert_terms_sorted = sorted(expert_terms, key=len, reverse=True)
-    matched_terms = []
-    text_lower = text.lower()
-    
-    for term in expert_terms_sorted:
-        if term.lower() in text_lower:
-            matched_terms.append(term)
-            # 이미 매칭된 부분을 제거하여 중복 카운트 방지 (간단한 방법)
-            # 실제로는 더 정교한 매칭이 필요할 수 있지만, 성능을 위해 단순화
+    # ✅ 성능 개선: 용어마다 `in` 검사를 반복하지 않고 캐시된 다중 패턴 인덱스로 본문을 한 번만 스캔
+    matched_terms = get_term_index(tuple(expert_terms)).find_all(text)
     
     expert_count = len(matched_terms)
     
@@ -2280,7 +2307,6 @@ def _render_search_result_news_popularity(df_view: pd.DataFrame):
                             news_titles[news_id_str] = str(title).strip()
         except Exception as e:
             # Supabase 조회 실패 시 에러 로깅 (디버깅용)
-            import traceback
             print(f"⚠️ Supabase에서 뉴스 제목 조회 실패: {e}")
             print(f"에러 상세: {traceback.format_exc()}")
             # 에러가 발생해도 계속 진행 (payload에서 가져온 제목만 사용)
@@ -2953,8 +2979,6 @@ def _render_kpi_dashboard(
                 return p.get("duration_sec")
             # JSON 문자열일 가능성
             try:
-                import json
-
                 obj = json.loads(p)
                 return obj.get("duration_sec")
             except Exception:
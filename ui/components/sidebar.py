@@ -1,7 +1,15 @@
 
 import streamlit as st
+from functools import lru_cache
 from core.config import API_ENABLE, API_BASE_URL, SUPABASE_ENABLE
 
+
+@lru_cache(maxsize=8)
+def _terms_markdown(term_names: tuple) -> str:
+    """용어 목록 마크다운 (용어 집합이 같으면 rerun마다 다시 만들지 않음)"""
+    return "\n".join(f"- {t}" for t in term_names)
+
+
 def render(terms: dict[str, dict]):
     with st.sidebar:
         
@@ -48,5 +56,5 @@ def render(terms: dict[str, dict]):
         st.subheader("📚 금융 용어 사전")
         st.write(f"등록된 용어: {len(terms)}개")
         with st.expander("용어 목록 보기"):
-            for t in terms.keys():
-                st.write(f"• {t}")
+            # ✅ 성능 개선: 용어마다 st.write를 호출하지 않고 하나의 마크다운 블록으로 전송
+            st.markdown(_terms_markdown(tuple(terms)))
@@ -5,6 +5,18 @@ import json
 from core.utils import llm_chat
 from core.config import DEFAULT_OPENAI_MODEL, DEFAULT_NEWS_SUMMARY_PROMPT
 
+# 뉴스 데이터가 없을 때 표시할 기본 안내
+_EMPTY_NEWS_SUMMARY = (
+    "오늘의 주요 금융 뉴스는 준비된 데이터가 없어 기본 안내를 표시합니다. "
+    "뉴스 수집이 가능해지면 다시 시도해 주세요."
+)
+
+# 뉴스 요약용 시스템 메시지
+_SUMMARY_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "너는 초보자에게 금융 시장 이슈를 정확하고 쉽게 요약하는 금융 전문 기자야."
+}
+
 
 # 📰 오늘의 금융 뉴스 요약 박스 렌더링 함수
 def _format_articles_for_prompt(articles):
@@ -32,10 +44,7 @@ def _build_fallback_summary(articles):
         articles = list(articles) if articles else []
 
     if not articles:
-        return (
-            "오늘의 주요 금융 뉴스는 준비된 데이터가 없어 기본 안내를 표시합니다. "
-            "뉴스 수집이 가능해지면 다시 시도해 주세요."
-        )
+        return _EMPTY_NEWS_SUMMARY
 
     bullets = []
     for item in articles[:3]:
@@ -76,22 +85,11 @@ def _generate_news_summary(articles_hash: str, articles_context: str, prompt_tem
     뉴스 요약 생성 (st.cache_data로 캐싱)
     - 뉴스 해시를 기반으로 캐시 키 생성
     - 같은 뉴스에 대해서는 세션 간 공유
+    - 에러는 그대로 전파 (st.cache_data는 예외를 캐싱하지 않으며, 호출하는 쪽에서 fallback 처리)
     """
-    from core.utils import llm_chat
-    
-    sys = {
-        "role": "system",
-        "content": "너는 초보자에게 금융 시장 이슈를 정확하고 쉽게 요약하는 금융 전문 기자야."
-    }
     user_prompt = prompt_template.format(articles=articles_context)
     usr = {"role": "user", "content": user_prompt}
-    
-    try:
-        summary = llm_chat([sys, usr], max_tokens=280, temperature=0.4)
-        return summary
-    except Exception as e:
-        # 에러 발생 시 빈 문자열 반환 (호출하는 쪽에서 fallback 처리)
-        raise e
+    return llm_chat([_SUMMARY_SYSTEM_MESSAGE, usr], max_tokens=280, temperature=0.4)
 
 
 def render(articles, use_openai: bool = False):